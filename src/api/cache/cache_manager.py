@@ -67,6 +67,33 @@ class CacheManager(CacheInterface):
         """
         return self.backend.set(key, value, params, ttl=ttl)
 
+    def get_many(self, keys, params=None):
+        """
+        批次取得多個快取內容
+
+        Args:
+            keys: 快取鍵值列表
+            params: 進階查詢參數（可選，套用於所有鍵值）
+
+        Returns:
+            list: 與 keys 順序對應的快取內容，不存在者為 None
+        """
+        return self.backend.get_many(keys, params)
+
+    def set_many(self, items, params=None, ttl: int = None):
+        """
+        批次存入多個快取內容
+
+        Args:
+            items: (鍵值, 內容) 列表
+            params: 進階查詢參數（可選，套用於所有項目）
+            ttl: 存活時間（秒），CrewAI Memory 中目前未實作
+
+        Returns:
+            int: 成功存入的筆數
+        """
+        return self.backend.set_many(items, params, ttl=ttl)
+
     def exists(self, key, params=None):
         """
         檢查快取是否存在於 CrewAI Memory 中
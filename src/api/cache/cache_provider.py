@@ -1,13 +1,17 @@
-import json
 import hashlib
 import time
-from typing import Dict, Any, Optional, Union
+from typing import Dict, Any, List, Optional, Tuple, Union
 from datetime import datetime
+
+import orjson
 from src.api.core.logger_config import get_logger
 from src.trailtag.memory.manager import CrewMemoryManager
 
 logger = get_logger(__name__)
 
+# 產生快取鍵值時的 JSON 序列化選項：鍵排序確保相同內容產生相同鍵值
+_KEY_DUMP_OPTS = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+
 
 class CrewAICacheProvider:
     """
@@ -36,7 +40,8 @@ class CrewAICacheProvider:
         """
         根據 query 與 params 產生唯一快取鍵值
 
-        使用 MD5 雜湊確保鍵值的唯一性和一致性，同時加上前綴便於管理。
+        使用 BLAKE2b-128 雜湊確保鍵值的唯一性和一致性（比 MD5 快且同為 32 字元十六進位），
+        同時加上前綴便於管理。
 
         Args:
             query: 查詢字串或字典
@@ -46,16 +51,15 @@ class CrewAICacheProvider:
             str: 唯一的快取鍵值
         """
         if isinstance(query, dict):
-            query_str = json.dumps(query, sort_keys=True, ensure_ascii=False)
+            key_material = orjson.dumps(query, option=_KEY_DUMP_OPTS)
         else:
-            query_str = str(query)
+            key_material = str(query).encode()
 
-        hash_input = query_str
         if params:
-            hash_input += json.dumps(params, sort_keys=True, ensure_ascii=False)
+            key_material += orjson.dumps(params, option=_KEY_DUMP_OPTS)
 
-        cache_key = f"{self.prefix}{hashlib.md5(hash_input.encode()).hexdigest()}"
-        return cache_key
+        digest = hashlib.blake2b(key_material, digest_size=16).hexdigest()
+        return f"{self.prefix}{digest}"
 
     def get(
         self, query: Union[str, Dict], params: Optional[Dict] = None
@@ -103,12 +107,7 @@ class CrewAICacheProvider:
                 latest_entry = max(matching_entries, key=lambda x: x["stored_at"])
                 cached_content = latest_entry["content"]
                 if cached_content:
-                    # 尝试解析 JSON
-                    try:
-                        return json.loads(cached_content)
-                    except json.JSONDecodeError:
-                        # 若不是 JSON，直接返回字串
-                        return cached_content
+                    return self._deserialize(cached_content)
 
             # 2. 如果精确匹配失败，尝试搜索（避免冒号问题）
             # 提取job ID进行搜索
@@ -128,10 +127,7 @@ class CrewAICacheProvider:
                         if original_query == query_str:
                             cached_content = result.get("content")
                             if cached_content:
-                                try:
-                                    return json.loads(cached_content)
-                                except json.JSONDecodeError:
-                                    return cached_content
+                                return self._deserialize(cached_content)
 
             return None
 
@@ -192,12 +188,7 @@ class CrewAICacheProvider:
                 )
 
             # 序列化結果（處理 datetime 對象）
-            if isinstance(result, (dict, list)):
-                content = json.dumps(
-                    result, ensure_ascii=False, default=self._json_serializer
-                )
-            else:
-                content = str(result)
+            content = self._serialize(result)
 
             # 存入 CrewAI Memory
             memory_id = self.memory.memory_storage.save(
@@ -223,6 +214,136 @@ class CrewAICacheProvider:
             self.logger.error(f"CrewAI Memory 設置快取失敗: {str(e)}")
             return False
 
+    def get_many(
+        self, queries: List[Union[str, Dict]], params: Optional[Dict] = None
+    ) -> List[Optional[Any]]:
+        """
+        批次獲取多個快取內容
+
+        只遍歷一次所有記憶記錄並建立索引，取代逐筆呼叫 get 時的 N 次完整掃描。
+
+        Args:
+            queries: 查詢內容列表
+            params: 額外查詢參數（套用於所有查詢）
+
+        Returns:
+            與 queries 順序對應的快取內容，不存在者為 None
+        """
+        try:
+            # 依 original_query 與 key 各自記錄最新的一筆 (stored_at, content)
+            by_query: Dict[str, Tuple[float, Any]] = {}
+            by_key: Dict[str, Tuple[float, Any]] = {}
+            for memory_entry in self.memory.memory_storage.memories.values():
+                metadata = memory_entry.metadata
+                if metadata.get("type") != "cache" or metadata.get("deleted", False):
+                    continue
+                record = (metadata.get("stored_at", 0), memory_entry.content)
+                for index, field in (
+                    (by_query, metadata.get("original_query", "")),
+                    (by_key, metadata.get("key", "")),
+                ):
+                    if field not in index or record[0] >= index[field][0]:
+                        index[field] = record
+
+            results = []
+            for query in queries:
+                query_str = str(query)
+                candidates = [
+                    record
+                    for record in (
+                        by_query.get(query_str),
+                        by_key.get(self._generate_key(query, params)),
+                    )
+                    if record is not None
+                ]
+                content = max(candidates, key=lambda r: r[0])[1] if candidates else None
+                if content:
+                    results.append(self._deserialize(content))
+                elif query_str.startswith("job:"):
+                    # 精確匹配失敗時沿用 get 的搜尋備援
+                    results.append(self.get(query, params))
+                else:
+                    results.append(None)
+            return results
+
+        except Exception as e:
+            self.logger.error(f"CrewAI Memory 批次獲取快取失敗: {str(e)}")
+            return [None] * len(queries)
+
+    def set_many(
+        self,
+        items: List[Tuple[Union[str, Dict], Any]],
+        params: Optional[Dict] = None,
+        ttl: Optional[int] = None,
+    ) -> int:
+        """
+        批次存入多個快取內容
+
+        只遍歷一次所有記憶記錄以找出需要軟刪除的舊記錄，再依序寫入新內容。
+
+        Args:
+            items: (query, result) 列表
+            params: 額外查詢參數（套用於所有項目）
+            ttl: 存活時間（秒），CrewAI Memory 中暫未使用
+
+        Returns:
+            int: 成功存入的筆數
+        """
+        try:
+            pending = {}
+            for query, result in items:
+                pending[str(query)] = (self._generate_key(query, params), result)
+            keys = {
+                cache_key: query_str for query_str, (cache_key, _) in pending.items()
+            }
+
+            # 找出與任一新項目相同鍵值的現有記錄
+            replaced = set()
+            for memory_entry in self.memory.memory_storage.memories.values():
+                metadata = memory_entry.metadata
+                if metadata.get("type") != "cache" or metadata.get("deleted", False):
+                    continue
+                original_query = metadata.get("original_query", "")
+                if original_query in pending:
+                    replaced.add(original_query)
+                elif metadata.get("key", "") in keys:
+                    replaced.add(keys[metadata["key"]])
+
+            stored = 0
+            now = time.time()
+            for query_str, (cache_key, result) in pending.items():
+                if query_str in replaced:
+                    self.memory.memory_storage.save(
+                        value="DELETED",
+                        metadata={
+                            "type": "cache",
+                            "key": cache_key,
+                            "original_query": query_str,
+                            "deleted": True,
+                            "deleted_at": now,
+                            "replaced_by": "new_entry",
+                        },
+                    )
+                memory_id = self.memory.memory_storage.save(
+                    value=self._serialize(result),
+                    metadata={
+                        "type": "cache",
+                        "key": cache_key,
+                        "original_query": query_str,
+                        "ttl": ttl,
+                        "stored_at": now,
+                    },
+                )
+                if memory_id is not None:
+                    stored += 1
+
+            self.logger.debug(f"批次存入快取: {stored}/{len(pending)} 筆")
+            return stored
+
+        except Exception as e:
+            self.logger.error(f"CrewAI Memory 批次設置快取失敗: {str(e)}")
+            return 0
+
     def exists(self, query: Union[str, Dict], params: Optional[Dict] = None) -> bool:
         """
         檢查快取是否存在於 CrewAI Memory 中
@@ -322,6 +443,24 @@ class CrewAICacheProvider:
             self.logger.error(f"CrewAI Memory 掃描鍵值失敗: {str(e)}")
             return []
 
+    def _serialize(self, result: Any) -> str:
+        """序列化快取內容：dict/list 以 orjson 轉為 JSON 字串，其餘轉為字串"""
+        if isinstance(result, (dict, list)):
+            return orjson.dumps(
+                result,
+                default=self._json_serializer,
+                option=orjson.OPT_NON_STR_KEYS,
+            ).decode()
+        return str(result)
+
+    @staticmethod
+    def _deserialize(content: str) -> Any:
+        """反序列化快取內容，非 JSON 內容直接回傳原字串"""
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            return content
+
     def _json_serializer(self, obj):
         """JSON 序列化處理器，處理 datetime 和其他特殊對象"""
         if isinstance(obj, datetime):
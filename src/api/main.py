@@ -36,6 +36,7 @@ TrailTag API 主應用程式模組
     - 開發模式: 熱重載與除錯支援
 """
 
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from typing import Dict, Any
@@ -45,6 +46,8 @@ from .middleware.sse_handler import router as sse_router
 from .monitoring.metrics import router as metrics_router, MetricsMiddleware
 from .cache.cache_manager import CacheManager
 from .monitoring.observability import observability
+from src.trailtag.tools.data_extraction import youtube_metadata
+from src.trailtag.tools.geocoding import place_geocoder
 import time
 import sys
 import os
@@ -61,11 +64,24 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 # 全域快取狀態
 cache = CacheManager()
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """應用程式生命週期：關閉時釋放工具層共用的 aiohttp session"""
+    yield
+    for tool_module in (youtube_metadata, place_geocoder):
+        try:
+            await tool_module.close_sessions()
+        except Exception as e:
+            logger.warning(f"關閉 {tool_module.__name__} HTTP session 失敗: {e}")
+
+
 # 創建 FastAPI 應用
 app = FastAPI(
     title="TrailTag API",
     description="YouTube 旅遊影片地圖化 API 服務 - 整合效能監控",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
 # 添加指標監控中間件
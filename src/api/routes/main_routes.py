@@ -382,11 +382,12 @@ async def analyze_video(
             "updated_at": now,
             "subtitle_availability": subtitle_status.model_dump(),
         }
-        cache.set(f"job:{job_id}", job, ttl=60)
-        # 建立 video_id -> job_id 映射，方便以 video_id 查詢目前對應的 job
-        try:
-            cache.set(f"video_job:{video_id}", job_id, ttl=60)
-        except Exception:
+        # 任務與 video_id -> job_id 映射 (方便以 video_id 查詢目前對應的 job)
+        # 以一次批次寫入，只掃描一次快取記錄
+        stored = cache.set_many(
+            [(f"job:{job_id}", job), (f"video_job:{video_id}", job_id)], ttl=60
+        )
+        if stored < 2:
             # 不應該阻斷主流程，僅記錄即可
             logger.debug(
                 {
@@ -411,11 +412,9 @@ async def analyze_video(
         "updated_at": now,
         "subtitle_availability": subtitle_status.model_dump(),
     }
-    cache.set(f"job:{job_id}", job)
-    # 設定 video_id -> job_id 映射，方便以 video_id 查詢目前對應的 job
-    try:
-        cache.set(f"video_job:{video_id}", job_id)
-    except Exception:
+    # 任務與 video_id -> job_id 映射 (方便以 video_id 查詢目前對應的 job) 一次寫入
+    stored = cache.set_many([(f"job:{job_id}", job), (f"video_job:{video_id}", job_id)])
+    if stored < 2:
         logger.debug(
             {"event": "video_job_map_failed", "video_id": video_id, "job_id": job_id}
         )
@@ -306,6 +306,30 @@ class CrewExecutor:
 
         return None
 
+    @trace("crew_executor.wait_for_job")
+    async def wait_for_job(
+        self, job_id: str, timeout: Optional[float] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        等待任務結束並回傳狀態
+
+        直接等待任務的 asyncio Task 完成，不需輪詢；任務已結束或不存在時立即回傳。
+
+        Args:
+            job_id: 任務ID
+            timeout: 最長等待秒數，None 表示不限；逾時回傳當下狀態
+
+        Returns:
+            Dict[str, Any]: 任務狀態信息，如果任務不存在返回 None
+        """
+        with self._lock:
+            future = self.job_futures.get(job_id)
+
+        if future is not None:
+            await asyncio.wait({future}, timeout=timeout)
+
+        return await self.get_job_status(job_id)
+
     @trace("crew_executor.cancel_job")
     async def cancel_job(self, job_id: str) -> bool:
         """
@@ -0,0 +1,134 @@
+"""
+持久化磁碟快取
+
+以 SQLite 實作的輕量鍵值快取，支援個別項目的存活時間 (TTL)。
+供工具層快取外部服務結果（地理編碼、影片資訊等），讓程序重啟後仍能重用。
+
+特性:
+    - 值以 JSON 序列化儲存 (orjson)，僅接受可 JSON 化的資料
+    - 執行緒安全：單一連線搭配鎖保護
+    - 過期項目於讀取時惰性刪除
+    - 以 get_disk_cache 於首次使用時才開啟，匯入模組不會觸及檔案系統
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+import orjson
+
+from src.api.core.logger_config import get_logger
+
+logger = get_logger(__name__)
+
+# 已開啟的具名快取，依快取檔案路徑索引 (開啟失敗記為 None，不重複嘗試)
+_opened_caches: dict[Path, Optional["DiskCache"]] = {}
+_opened_caches_lock = threading.Lock()
+
+
+def default_cache_dir() -> Path:
+    """
+    取得快取根目錄
+
+    優先使用 TRAILTAG_CACHE_DIR 環境變數，否則為 ~/.cache/trailtag
+    """
+    return Path(os.getenv("TRAILTAG_CACHE_DIR", "~/.cache/trailtag")).expanduser()
+
+
+class DiskCache:
+    """
+    SQLite 鍵值快取
+
+    Args:
+        path: SQLite 檔案路徑，父目錄不存在時自動建立
+    """
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            str(self.path), check_same_thread=False, isolation_level=None
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache ("
+            "key TEXT PRIMARY KEY, value BLOB NOT NULL, expire_at REAL)"
+        )
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """取得快取值，不存在或已過期時回傳 default"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expire_at FROM cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return default
+            value, expire_at = row
+            if expire_at is not None and expire_at <= time.time():
+                self._conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+                return default
+        return orjson.loads(value)
+
+    def set(self, key: str, value: Any, expire: Optional[float] = None) -> None:
+        """
+        寫入快取值
+
+        Args:
+            key: 快取鍵值
+            value: 可 JSON 序列化的資料
+            expire: 存活秒數，None 表示永不過期
+        """
+        expire_at = time.time() + expire if expire is not None else None
+        payload = orjson.dumps(value)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache (key, value, expire_at) VALUES (?, ?, ?)",
+                (key, payload, expire_at),
+            )
+
+    def delete(self, key: str) -> None:
+        """刪除快取項目"""
+        with self._lock:
+            self._conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        """清除所有快取項目"""
+        with self._lock:
+            self._conn.execute("DELETE FROM cache")
+
+
+def open_disk_cache(name: str) -> Optional[DiskCache]:
+    """
+    開啟快取根目錄下的具名快取
+
+    無法建立時（如目錄無寫入權限）記錄警告並回傳 None，呼叫端應退回無快取模式。
+
+    Args:
+        name: 快取名稱，對應 {cache_dir}/{name}.sqlite3
+    """
+    try:
+        return DiskCache(default_cache_dir() / f"{name}.sqlite3")
+    except Exception as e:
+        logger.warning(f"無法開啟磁碟快取 {name}，將不使用持久化快取: {e}")
+        return None
+
+
+def get_disk_cache(name: str) -> Optional[DiskCache]:
+    """
+    取得具名快取，首次使用時才開啟
+
+    快取位置於每次呼叫時依 TRAILTAG_CACHE_DIR 決定，同一路徑共用一個實例；
+    測試可將 TRAILTAG_CACHE_DIR 指向暫存目錄，與實際執行的快取隔離。
+
+    Args:
+        name: 快取名稱，對應 {cache_dir}/{name}.sqlite3
+    """
+    path = default_cache_dir() / f"{name}.sqlite3"
+    with _opened_caches_lock:
+        if path not in _opened_caches:
+            _opened_caches[path] = open_disk_cache(name)
+        return _opened_caches[path]
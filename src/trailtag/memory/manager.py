@@ -511,6 +511,33 @@ class CrewMemoryManager:
         """取得分析結果"""
         return self.analysis_results.get(video_id)
 
+    def _build_agent_memory_entry(
+        self,
+        agent_role: str,
+        context: str,
+        entities: List[Dict[str, Any]] = None,
+        relationships: List[Dict[str, Any]] = None,
+        insights: List[str] = None,
+        confidence: float = 1.0,
+    ) -> AgentMemoryEntry:
+        """建立 Agent 記憶項目"""
+        return AgentMemoryEntry(
+            agent_role=agent_role,
+            memory_type=MemoryType.LONG_TERM,
+            context=context,
+            entities=entities or [],
+            relationships=relationships or [],
+            insights=insights or [],
+            confidence=confidence,
+            created_at=datetime.now(timezone.utc),
+        )
+
+    def _add_agent_memory(self, entry: AgentMemoryEntry) -> str:
+        """將 Agent 記憶加入記憶體索引（不寫入檔案），回傳記憶 ID"""
+        memories = self.agent_memories.setdefault(entry.agent_role, [])
+        memories.append(entry)
+        return f"{entry.agent_role}_{len(memories)}"
+
     def save_agent_memory(
         self,
         agent_role: str,
@@ -522,30 +549,54 @@ class CrewMemoryManager:
     ) -> str:
         """儲存 Agent 記憶"""
         try:
-            entry = AgentMemoryEntry(
+            entry = self._build_agent_memory_entry(
                 agent_role=agent_role,
-                memory_type=MemoryType.LONG_TERM,
                 context=context,
-                entities=entities or [],
-                relationships=relationships or [],
-                insights=insights or [],
+                entities=entities,
+                relationships=relationships,
+                insights=insights,
                 confidence=confidence,
-                created_at=datetime.now(timezone.utc),
             )
-
-            if agent_role not in self.agent_memories:
-                self.agent_memories[agent_role] = []
-
-            self.agent_memories[agent_role].append(entry)
+            memory_id = self._add_agent_memory(entry)
             self._persist_agent_memory(entry)
 
             logger.debug(f"儲存 Agent 記憶: {agent_role}")
-            return f"{agent_role}_{len(self.agent_memories[agent_role])}"
+            return memory_id
 
         except Exception as e:
             logger.error(f"儲存 Agent 記憶失敗: {e}")
             raise
 
+    def save_agent_memory_bulk(self, items: List[Dict[str, Any]]) -> List[str]:
+        """
+        批次儲存 Agent 記憶
+
+        每筆參數與 save_agent_memory 相同；全部加入後只寫入檔案一次，
+        避免逐筆儲存時每次都重寫整份 agent_memories.json。
+
+        Args:
+            items: 記憶參數字典列表，需包含 agent_role 與 context
+
+        Returns:
+            List[str]: 各筆記憶 ID，順序與 items 相同
+        """
+        try:
+            memory_ids = []
+            entry = None
+            for item in items:
+                entry = self._build_agent_memory_entry(**item)
+                memory_ids.append(self._add_agent_memory(entry))
+
+            if entry is not None:
+                self._persist_agent_memory(entry)
+
+            logger.debug(f"批次儲存 Agent 記憶: {len(memory_ids)} 筆")
+            return memory_ids
+
+        except Exception as e:
+            logger.error(f"批次儲存 Agent 記憶失敗: {e}")
+            raise
+
     def query_agent_memories(
         self, agent_role: str, query: str, limit: int = 10
     ) -> List[AgentMemoryEntry]:
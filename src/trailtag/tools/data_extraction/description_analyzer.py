@@ -7,8 +7,10 @@
 import re
 import json
 import logging
+from itertools import islice
 from typing import List, Optional, Tuple
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
+import orjson
 from crewai.tools import BaseTool
 from pydantic import BaseModel, Field
 
@@ -21,12 +23,44 @@ except ImportError as e:
     DEPENDENCIES_AVAILABLE = False
     logging.warning(f"Description analyzer dependencies not available: {e}")
 
+# torch 只用於 GPU 設定與情感分析的直接推論；缺少時其餘 NLP 功能照常運作
+try:
+    import torch
+
+    TORCH_AVAILABLE = True
+except ImportError:
+    TORCH_AVAILABLE = False
+
 from src.api.core.logger_config import get_logger
 
 logger = get_logger(__name__)
 
-
-@dataclass
+# spaCy GPU 設定只需在程序內執行一次 (於首個分析器初始化時)
+_gpu_preference_set = False
+
+# 關鍵詞回退提取用的英文單字樣式與基本停用詞
+_WORD_RE = re.compile(r"\b[a-zA-Z]{3,}\b")
+STOP_WORDS = frozenset(
+    {
+        "the",
+        "and",
+        "but",
+        "are",
+        "was",
+        "were",
+        "been",
+        "have",
+        "has",
+        "had",
+        "will",
+        "would",
+        "could",
+        "should",
+    }
+)
+
+
+@dataclass(slots=True, frozen=True)
 class ExtractedLocation:
     """提取的地點資訊"""
 
@@ -38,7 +72,7 @@ class ExtractedLocation:
     coordinates: Optional[Tuple[float, float]] = None  # 如果能解析出座標
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ExtractedTimestamp:
     """提取的時間戳記資訊"""
 
@@ -48,7 +82,7 @@ class ExtractedTimestamp:
     confidence: float
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DescriptionAnalysisResult:
     """描述分析結果"""
 
@@ -60,6 +94,23 @@ class DescriptionAnalysisResult:
     sentiment: str  # positive, negative, neutral
 
 
+def _prefer_gpu() -> None:
+    """有 GPU 時讓 spaCy 使用 GPU，否則維持 CPU；須在載入模型前呼叫"""
+    global _gpu_preference_set
+    if _gpu_preference_set:
+        return
+    _gpu_preference_set = True
+    try:
+        spacy.prefer_gpu()
+    except Exception as e:
+        logger.warning(f"spaCy GPU initialization skipped: {e}")
+
+
+def _slots_to_dict(obj) -> dict:
+    """依 __slots__ 欄位淺層轉換為 dict（取代 asdict 的遞迴 deepcopy）"""
+    return {name: getattr(obj, name) for name in obj.__slots__}
+
+
 class DescriptionAnalyzerInput(BaseModel):
     """描述分析器輸入模型"""
 
@@ -100,6 +151,8 @@ class DescriptionAnalyzer(BaseTool):
             logger.warning(
                 "Dependencies not available, analyzer will use basic extraction only"
             )
+        elif TORCH_AVAILABLE:
+            _prefer_gpu()
 
     @property
     def nlp_model(self):
@@ -248,14 +301,17 @@ class DescriptionAnalyzer(BaseTool):
 
         return locations
 
-    def _extract_locations_advanced(self, text: str) -> List[ExtractedLocation]:
-        """進階地點提取（使用 ML 模型）"""
+    def _extract_locations_advanced(
+        self, text: str, doc=None
+    ) -> List[ExtractedLocation]:
+        """進階地點提取（使用 ML 模型，doc 為已解析的 spaCy Doc）"""
         locations = []
 
         try:
             # 使用 spaCy 進行 NER
             if self.nlp_model:
-                doc = self.nlp_model(text)
+                if doc is None:
+                    doc = self.nlp_model(text)
                 for ent in doc.ents:
                     if ent.label_ in [
                         "GPE",
@@ -305,7 +361,7 @@ class DescriptionAnalyzer(BaseTool):
 
     def _classify_location_type(self, location_name: str, entity_label: str) -> str:
         """分類地點類型"""
-        location_lower = location_name.lower()
+        location_lower = location_name.casefold()
 
         # 地標關鍵詞
         if any(
@@ -354,13 +410,16 @@ class DescriptionAnalyzer(BaseTool):
             else:
                 return "unknown"
 
-    def _extract_keywords(self, text: str) -> List[str]:
-        """提取關鍵詞"""
+    def _extract_keywords(
+        self, text: str, text_lower: Optional[str] = None, doc=None
+    ) -> List[str]:
+        """提取關鍵詞（text_lower 為預先計算的 casefold 文本，doc 為已解析的 spaCy Doc）"""
         keywords = []
 
         try:
             if self.nlp_model:
-                doc = self.nlp_model(text)
+                if doc is None:
+                    doc = self.nlp_model(text)
                 # 提取名詞和形容詞作為關鍵詞
                 keywords = [
                     token.lemma_.lower()
@@ -374,43 +433,45 @@ class DescriptionAnalyzer(BaseTool):
                 keywords = list(set(keywords))[:20]
             else:
                 # 簡單的關鍵詞提取
-                import re
-
-                words = re.findall(r"\b[a-zA-Z]{3,}\b", text.lower())
+                if text_lower is None:
+                    text_lower = text.casefold()
+                words = _WORD_RE.findall(text_lower)
                 # 基本停用詞過濾
-                stop_words = {
-                    "the",
-                    "and",
-                    "but",
-                    "are",
-                    "was",
-                    "were",
-                    "been",
-                    "have",
-                    "has",
-                    "had",
-                    "will",
-                    "would",
-                    "could",
-                    "should",
-                }
-                keywords = [word for word in set(words) if word not in stop_words][:15]
+                keywords = [word for word in set(words) if word not in STOP_WORDS][:15]
 
         except Exception as e:
             logger.error(f"Keyword extraction failed: {e}")
 
         return keywords
 
-    def _generate_summary(self, text: str) -> str:
-        """生成文本摘要"""
+    def _generate_summary(self, text: str, doc=None) -> str:
+        """生成文本摘要（doc 為已解析的 spaCy Doc，可用其斷句結果）"""
         if len(text) < 100:
             return text
 
         try:
+            # 有 spaCy 斷句結果時直接取前3句，不受語言標點限制
+            if doc is not None and doc.has_annotation("SENT_START"):
+                sents = list(islice(doc.sents, 3))
+                if len(sents) == 3:
+                    return text[: sents[-1].end_char].strip()
+
             # 簡單的摘要邏輯：取前3句話或前200字符
-            sentences = text.split("。")
-            if len(sentences) >= 3:
-                summary = "。".join(sentences[:3]) + "。"
+            # 以 str.find 逐一定位句號，只掃描到第3句為止，避免切出整篇句子列表
+            end = -1
+            found = 0
+            while found < 3:
+                nxt = text.find("。", end + 1)
+                if nxt == -1:
+                    break
+                end = nxt
+                found += 1
+
+            if found == 3:
+                summary = text[: end + 1]
+            elif found == 2:
+                # 第3句為剩餘全文
+                summary = text if text.endswith("。") else text + "。"
             else:
                 summary = text[:200] + ("..." if len(text) > 200 else "")
 
@@ -420,12 +481,24 @@ class DescriptionAnalyzer(BaseTool):
             logger.error(f"Summary generation failed: {e}")
             return text[:150] + ("..." if len(text) > 150 else "")
 
-    def _analyze_sentiment(self, text: str) -> str:
-        """分析文本情感"""
+    def _analyze_sentiment(self, text: str, text_lower: Optional[str] = None) -> str:
+        """分析文本情感（text_lower 為呼叫端預先計算的 casefold 文本）"""
         try:
             if self.sentiment_pipeline:
-                result = self.sentiment_pipeline(text[:512])  # 限制長度
-                label = result[0]["label"].lower()
+                pipe = self.sentiment_pipeline
+                if TORCH_AVAILABLE:
+                    # 直接以 tokenizer 依 token 數截斷（上限 512 tokens）後送入模型，
+                    # 省去 pipeline 內部的第二次 tokenize
+                    inputs = pipe.tokenizer(
+                        text, truncation=True, max_length=512, return_tensors="pt"
+                    ).to(pipe.device)
+                    with torch.inference_mode():
+                        logits = pipe.model(**inputs).logits
+                    label_id = int(logits.argmax(dim=-1)[0])
+                    label = pipe.model.config.id2label[label_id].lower()
+                else:
+                    label = pipe(text, truncation=True, max_length=512)[0]["label"]
+                    label = label.lower()
                 return (
                     "positive"
                     if label == "positive"
@@ -460,7 +533,8 @@ class DescriptionAnalyzer(BaseTool):
                     "hate",
                 ]
 
-                text_lower = text.lower()
+                if text_lower is None:
+                    text_lower = text.casefold()
                 pos_count = sum(1 for word in positive_words if word in text_lower)
                 neg_count = sum(1 for word in negative_words if word in text_lower)
 
@@ -493,6 +567,61 @@ class DescriptionAnalyzer(BaseTool):
 
     def _run(self, description: str, video_id: str, language: str = "auto") -> str:
         """執行描述分析"""
+        return self._analyze(description, video_id, language)
+
+    def analyze_batch(
+        self,
+        descriptions: List[str],
+        video_ids: Optional[List[str]] = None,
+        language: str = "auto",
+    ) -> List[str]:
+        """
+        批次分析多筆描述
+
+        以 nlp.pipe 一次批次解析所有描述，再將解析好的 Doc 交給各筆分析重用，
+        適用於頻道匯入、重新索引等大量描述的情境。
+
+        Args:
+            descriptions: 影片描述文本列表
+            video_ids: 對應的影片ID列表，省略時以索引代替
+            language: 文本語言，auto為自動檢測
+
+        Returns:
+            與 _run 相同格式的 JSON 字串列表
+
+        Raises:
+            ValueError: video_ids 與 descriptions 數量不一致
+        """
+        if video_ids is None:
+            video_ids = [str(i) for i in range(len(descriptions))]
+        elif len(video_ids) != len(descriptions):
+            raise ValueError(
+                f"video_ids 數量 ({len(video_ids)}) 與 descriptions 數量 "
+                f"({len(descriptions)}) 不一致"
+            )
+
+        docs = [None] * len(descriptions)
+        if DEPENDENCIES_AVAILABLE and self.nlp_model:
+            try:
+                docs = list(
+                    self.nlp_model.pipe(
+                        [d or "" for d in descriptions], batch_size=64, n_process=1
+                    )
+                )
+            except Exception as e:
+                logger.error(f"Batch spaCy parsing failed: {e}")
+
+        return [
+            self._analyze(description, video_id, language, doc)
+            for description, video_id, doc in zip(
+                descriptions, video_ids, docs, strict=True
+            )
+        ]
+
+    def _analyze(
+        self, description: str, video_id: str, language: str = "auto", doc=None
+    ) -> str:
+        """分析單筆描述，doc 為已解析的 spaCy Doc（可選）"""
         try:
             logger.info(f"Analyzing description for video {video_id}")
 
@@ -501,6 +630,14 @@ class DescriptionAnalyzer(BaseTool):
                     {"error": "Empty description provided", "video_id": video_id}
                 )
 
+            # 整篇描述只做一次 casefold，供後續各步驟共用
+            text_lower = description.casefold()
+
+            # spaCy 只解析一次，地點與關鍵詞提取共用同一個 Doc
+            use_nlp = DEPENDENCIES_AVAILABLE and self.nlp_model
+            if use_nlp and doc is None:
+                doc = self.nlp_model(description)
+
             # 檢測語言
             detected_language = (
                 self._detect_language(description) if language == "auto" else language
@@ -510,8 +647,8 @@ class DescriptionAnalyzer(BaseTool):
             timestamps = self._extract_timestamps(description)
 
             # 提取地點資訊
-            if DEPENDENCIES_AVAILABLE and self.nlp_model:
-                locations = self._extract_locations_advanced(description)
+            if use_nlp:
+                locations = self._extract_locations_advanced(description, doc)
             else:
                 locations = self._extract_locations_basic(description)
 
@@ -519,18 +656,19 @@ class DescriptionAnalyzer(BaseTool):
             unique_locations = []
             seen_names = set()
             for loc in locations:
-                if loc.name.lower() not in seen_names:
+                name_key = loc.name.casefold()
+                if name_key not in seen_names:
                     unique_locations.append(loc)
-                    seen_names.add(loc.name.lower())
+                    seen_names.add(name_key)
 
             # 提取關鍵詞
-            keywords = self._extract_keywords(description)
+            keywords = self._extract_keywords(description, text_lower, doc)
 
             # 生成摘要
-            summary = self._generate_summary(description)
+            summary = self._generate_summary(description, doc)
 
             # 分析情感
-            sentiment = self._analyze_sentiment(description)
+            sentiment = self._analyze_sentiment(description, text_lower)
 
             # 組裝結果
             result = DescriptionAnalysisResult(
@@ -542,14 +680,21 @@ class DescriptionAnalyzer(BaseTool):
                 sentiment=sentiment,
             )
 
-            # 轉換為 JSON
-            result_dict = asdict(result)
+            # 轉換為 JSON（淺層轉換，避免 asdict 的遞迴 deepcopy）
+            result_dict = {
+                "locations": [_slots_to_dict(loc) for loc in result.locations],
+                "timestamps": [_slots_to_dict(ts) for ts in result.timestamps],
+                "keywords": result.keywords,
+                "summary": result.summary,
+                "language": result.language,
+                "sentiment": result.sentiment,
+            }
 
             logger.info(
                 f"Description analysis completed: {len(unique_locations)} locations, {len(timestamps)} timestamps, {len(keywords)} keywords"
             )
 
-            return json.dumps(result_dict, ensure_ascii=False, indent=2)
+            return orjson.dumps(result_dict, option=orjson.OPT_INDENT_2).decode()
 
         except Exception as e:
             logger.error(f"Description analysis failed: {e}")
@@ -1,16 +1,298 @@
 from src.api.core.logger_config import get_logger
+from src.common.disk_cache import get_disk_cache
+from src.common.http_utils import DEFAULT_HEADERS, close_loop_sessions
 from crewai.tools import BaseTool
-from typing import Type
+from typing import ClassVar, Sequence, Type
 from pydantic import BaseModel, Field
 from src.trailtag.core.models import VideoMetadata, SubtitleAvailability
 import yt_dlp
 from datetime import datetime
-import requests
-import json
+import asyncio
+import codecs
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import weakref
+import aiohttp
+import orjson
 
 # 設定 logger 以便記錄除錯與警告訊息
 logger = get_logger(__name__)
 
+# 同時下載字幕的上限，避免觸發 YouTube 對單一 IP 的限流
+MAX_SUBTITLE_DOWNLOADS = 8
+# 串流下載字幕時每次讀取的位元組數
+_SUBTITLE_READ_CHUNK = 65536
+
+# 字幕語言優先順序：繁中 > 繁中變體 > 簡中 > 簡中變體 > 英文
+_PREFERRED_LANGS_ORDERED: tuple[str, ...] = (
+    "zh-TW",
+    "zh-Hant",
+    "zh-CN",
+    "zh-Hans",
+    "en",
+)
+_PREFERRED_LANGS: frozenset[str] = frozenset(_PREFERRED_LANGS_ORDERED)
+
+# 字幕格式優先順序：json3 體積最小且可直接以 JSON 解析，其次為 vtt、srt
+_SUBTITLE_EXT_PREFERENCE: tuple[str, ...] = ("json3", "vtt", "srt")
+
+# 每個事件迴圈各自持有一個 aiohttp session 與下載信號量（aiohttp 物件綁定建立時的迴圈）
+_sessions: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+_download_semaphores: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+# 同步呼叫端共用的背景事件迴圈
+_background_loop: asyncio.AbstractEventLoop | None = None
+_background_loop_lock = threading.Lock()
+
+
+def get_session() -> aiohttp.ClientSession:
+    """
+    取得目前事件迴圈共用的 aiohttp session
+
+    延遲建立並重用同一個連線池，讓多支影片的字幕下載共用 keep-alive 連線，
+    省去每次請求的 TCP/TLS 握手。閒置連線保留 60 秒（預設 15 秒），
+    讓間隔較長的連續任務仍能重用既有連線。
+    """
+    loop = asyncio.get_running_loop()
+    session = _sessions.get(loop)
+    if session is None or session.closed:
+        session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=32, limit_per_host=8, ttl_dns_cache=300, keepalive_timeout=60
+            ),
+            headers=DEFAULT_HEADERS,
+        )
+        _sessions[loop] = session
+    return session
+
+
+async def close_sessions() -> None:
+    """關閉所有事件迴圈上共用的 aiohttp session，供應用程式關閉時呼叫"""
+    await close_loop_sessions(_sessions)
+
+
+def _get_download_semaphore() -> asyncio.Semaphore:
+    """取得目前事件迴圈的字幕下載信號量"""
+    loop = asyncio.get_running_loop()
+    semaphore = _download_semaphores.get(loop)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(MAX_SUBTITLE_DOWNLOADS)
+        _download_semaphores[loop] = semaphore
+    return semaphore
+
+
+def _run_sync(coro):
+    """
+    在背景事件迴圈上執行協程並等待結果
+
+    供 CrewAI 與 API 路由等同步呼叫端使用。使用常駐的背景迴圈而非 asyncio.run，
+    使共用 session 能跨呼叫重用，且呼叫端本身處於事件迴圈中時也能正常運作。
+    """
+    global _background_loop
+    with _background_loop_lock:
+        if _background_loop is None:
+            _background_loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=_background_loop.run_forever,
+                name="youtube-metadata-io",
+                daemon=True,
+            ).start()
+    return asyncio.run_coroutine_threadsafe(coro, _background_loop).result()
+
+
+# yt-dlp 擷取設定（所有影片共用）
+_YDL_OPTS = {
+    "skip_download": True,
+    "quiet": True,
+    "no_warnings": True,
+    "writesubtitles": False,
+    "writeautomaticsub": False,
+    "extract_flat": False,
+    # 避免 YouTube 反爬蟲機制 - 更新配置
+    "user_agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "extractor_args": {
+        "youtube": {
+            "player_client": ["android", "web"],
+            "player_skip": ["configs", "webpage"],
+        }
+    },
+    "noplaylist": True,
+    # 只需要影片資訊與字幕清單，略過 DASH/HLS 格式清單的額外請求
+    "youtube_include_dash_manifest": False,
+    "youtube_include_hls_manifest": False,
+    # 不指定格式，讓 yt-dlp 自己選擇
+}
+
+# yt-dlp 擷取專用執行緒池；每條執行緒重用自己的 YoutubeDL 實例以攤提初始化成本
+_YDL_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="ytdlp")
+_ydl_local = threading.local()
+
+
+def _get_thread_ydl() -> yt_dlp.YoutubeDL:
+    """取得目前執行緒專屬的 YoutubeDL 實例（延遲建立）"""
+    ydl = getattr(_ydl_local, "ydl", None)
+    if ydl is None:
+        ydl = yt_dlp.YoutubeDL(_YDL_OPTS)
+        _ydl_local.ydl = ydl
+    return ydl
+
+
+def _extract_info_sync(url: str) -> dict:
+    """以 yt-dlp 同步擷取影片資訊（不下載影片）"""
+    return _get_thread_ydl().extract_info(url, download=False)
+
+
+# 影片資訊與字幕內容的磁碟快取，重複處理同一支影片時可略過 yt-dlp 擷取與字幕下載
+_INFO_CACHE_TTL = 6 * 3600
+_SUBTITLE_CACHE_TTL = 7 * 86400
+# 下游實際使用的 info 欄位，只快取這些以縮小儲存體積
+_INFO_KEYS = (
+    "id",
+    "title",
+    "description",
+    "upload_date",
+    "duration",
+    "tags",
+    "categories",
+    "webpage_url",
+    "subtitles",
+    "automatic_captions",
+)
+# 磁碟快取名稱；快取於首次讀寫時才開啟 (見 get_disk_cache)
+_INFO_CACHE = "youtube_info"
+_SUBTITLE_CACHE = "youtube_subtitles"
+
+
+def _cache_get(name: str, key: str):
+    """讀取磁碟快取，快取不可用或讀取失敗時回傳 None"""
+    cache = get_disk_cache(name)
+    if cache is None:
+        return None
+    try:
+        return cache.get(key)
+    except Exception as e:
+        logger.warning(f"讀取磁碟快取失敗 ({key}): {e}")
+        return None
+
+
+def _cache_set(name: str, key: str, value, expire: float) -> None:
+    """寫入磁碟快取，失敗時僅記錄警告"""
+    cache = get_disk_cache(name)
+    if cache is None:
+        return
+    try:
+        cache.set(key, value, expire=expire)
+    except Exception as e:
+        logger.warning(f"寫入磁碟快取失敗 ({key}): {e}")
+
+
+def _extract_info_cached(video_id: str, url: str) -> dict:
+    """擷取影片資訊，優先使用磁碟快取；未命中時呼叫 yt-dlp 並快取所需欄位"""
+    info = _cache_get(_INFO_CACHE, video_id)
+    if info is not None:
+        return info
+    # 在工作執行緒內即投影為所需欄位，完整 info (含格式清單) 不會離開此函式
+    full_info = _extract_info_sync(url)
+    info = {key: full_info[key] for key in _INFO_KEYS if key in full_info}
+    _cache_set(_INFO_CACHE, video_id, info, _INFO_CACHE_TTL)
+    return info
+
+
+def _parse_yyyymmdd(value: str) -> datetime | None:
+    """以字串切片解析 YYYYMMDD 日期，比 strptime 快且無需解析格式字串；失敗回傳 None"""
+    try:
+        return datetime(int(value[:4]), int(value[4:6]), int(value[6:8]))
+    except (TypeError, ValueError):
+        return None
+
+
+def _coerce_keywords(keywords) -> list[str] | None:
+    """將 tags/categories 統一為字串列表，空值回傳 None"""
+    if not keywords:
+        return None
+    return keywords if isinstance(keywords, list) else [str(keywords)]
+
+
+def _pick_subtitle_format(fmts: list[dict] | None) -> dict | None:
+    """
+    從單一語言的字幕格式列表中選出要下載的格式
+
+    依 _SUBTITLE_EXT_PREFERENCE 順序挑選，皆無時取第一個有 URL 的格式。
+    """
+    if not fmts:
+        return None
+    by_ext = {f.get("ext"): f for f in reversed(fmts) if f.get("url")}
+    for ext in _SUBTITLE_EXT_PREFERENCE:
+        if ext in by_ext:
+            return by_ext[ext]
+    return next((f for f in fmts if f.get("url")), None)
+
+
+def parse_json3(data: bytes | str) -> list[tuple[float, float, str]]:
+    """
+    解析 YouTube json3 字幕
+
+    Args:
+        data: json3 原始內容
+
+    Returns:
+        list[tuple[float, float, str]]: (開始秒數, 持續秒數, 文字) 列表，略過無文字的事件
+    """
+    segments = []
+    for event in orjson.loads(data).get("events") or ():
+        segs = event.get("segs")
+        if not segs:
+            continue
+        text = "".join(seg.get("utf8", "") for seg in segs).strip()
+        if text:
+            segments.append(
+                (
+                    event.get("tStartMs", 0) / 1000,
+                    event.get("dDurationMs", 0) / 1000,
+                    text,
+                )
+            )
+    return segments
+
+
+def _format_srt_time(seconds: float) -> str:
+    """將秒數轉為 SRT 時間戳 (HH:MM:SS,mmm)"""
+    hours, ms = divmod(round(seconds * 1000), 3_600_000)
+    minutes, ms = divmod(ms, 60_000)
+    secs, ms = divmod(ms, 1000)
+    return f"{hours:02d}:{minutes:02d}:{secs:02d},{ms:03d}"
+
+
+def _segments_to_srt(segments: list[tuple[float, float, str]]) -> str:
+    """將 parse_json3 的結果轉為 SRT 文字，維持 VideoMetadata.subtitles 的字串格式"""
+    return "\n".join(
+        f"{i}\n{_format_srt_time(start)} --> {_format_srt_time(start + duration)}\n{text}\n"
+        for i, (start, duration, text) in enumerate(segments, 1)
+    )
+
+
+async def _download_subtitle(url: str, ext: str | None) -> str:
+    """
+    下載字幕並轉為文字
+
+    json3 需完整內容才能解析，讀取後直接轉為 SRT；其他格式邊接收邊以增量解碼器解碼，
+    不必先保留完整的原始位元組再整段解碼。
+    """
+    session = get_session()
+    async with _get_download_semaphore():
+        async with session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as resp:
+            resp.raise_for_status()
+            if ext == "json3":
+                # json3 直接解析為片段後轉為 SRT，省去下游再解析原始格式
+                return _segments_to_srt(parse_json3(await resp.read()))
+            decoder = codecs.getincrementaldecoder(resp.charset or "utf-8")()
+            parts = [
+                decoder.decode(buf)
+                async for buf in resp.content.iter_chunked(_SUBTITLE_READ_CHUNK)
+            ]
+            parts.append(decoder.decode(b"", final=True))
+            return "".join(parts)
+
 
 class YoutubeMetadataToolInput(BaseModel):
     """
@@ -48,7 +330,7 @@ class YoutubeMetadataTool(BaseTool):
 
     技術特色:
         - 多語言支援: 優先繁體中文、簡體中文、英文字幕
-        - 格式智慧選擇: 優先 SRT 格式，確保時間軸準確性
+        - 格式智慧選擇: 優先 json3 格式並轉為 SRT，確保時間軸準確性
         - 健全的錯誤處理: 多層次的例外捕獲與回復機制
         - 效能優化: 使用 yt-dlp 的最佳化配置
 
@@ -59,7 +341,7 @@ class YoutubeMetadataTool(BaseTool):
 
     相依套件:
         - yt-dlp: YouTube 影片資訊擷取的核心引擎
-        - requests: HTTP 請求處理，用於字幕下載
+        - aiohttp: 非同步 HTTP 請求處理，用於字幕下載
         - pydantic: 資料驗證與序列化
 
     輸出資料:
@@ -75,6 +357,9 @@ class YoutubeMetadataTool(BaseTool):
     description: str = "根據 video_id 取得 YouTube 影片的 metadata（含字幕資訊），回傳 VideoMetadata Pydantic 物件。"
     args_schema: Type[BaseModel] = YoutubeMetadataToolInput
 
+    # 批次擷取時的同時影片數上限；YouTube 會對單一 IP 的大量並行請求限流，建議不超過 6
+    MAX_CONCURRENCY: ClassVar[int] = 6
+
     def _detect_subtitle_availability(self, info: dict) -> SubtitleAvailability:
         """
         智慧字幕可用性檢測與品質評估
@@ -143,18 +428,12 @@ class YoutubeMetadataTool(BaseTool):
             if manual_subtitles:
                 # 手動字幕品質較高
                 confidence_score = 0.9
-                if any(
-                    lang in ["zh-TW", "zh-Hant", "zh-CN", "zh-Hans", "en"]
-                    for lang in manual_subtitles
-                ):
+                if not _PREFERRED_LANGS.isdisjoint(manual_subtitles):
                     confidence_score = 0.95
             elif auto_caption_langs:
                 # 自動字幕品質較低
                 confidence_score = 0.7
-                if any(
-                    lang in ["zh-TW", "zh-Hant", "zh-CN", "zh-Hans", "en"]
-                    for lang in auto_caption_langs
-                ):
+                if not _PREFERRED_LANGS.isdisjoint(auto_caption_langs):
                     confidence_score = 0.75
 
             return SubtitleAvailability(
@@ -176,47 +455,42 @@ class YoutubeMetadataTool(BaseTool):
             )
 
     def _extract_subtitle_url(
-        self, info: dict, preferred_langs: list[str]
-    ) -> tuple[str | None, str | None]:
+        self, info: dict, preferred_langs: Sequence[str] = _PREFERRED_LANGS_ORDERED
+    ) -> tuple[str | None, str | None, str | None]:
         """
-        根據優先語言，從 info 取得字幕的 URL 與格式。
+        根據優先語言，從 info 取得字幕的 URL、語言與格式。
 
         搜尋順序：
-        1. 手動字幕 (subtitles)
-        2. 自動字幕 (automatic_captions)
-        3. 依 preferred_langs 順序尋找
-        4. 優先 srt 格式，否則取第一個可用字幕
+        1. 手動字幕 (subtitles)，若無則使用自動字幕 (automatic_captions)
+        2. 依 preferred_langs 順序尋找，找不到再依序嘗試其餘語言
+        3. 每個語言依 json3 > vtt > srt 挑選格式，否則取第一個可用格式
 
         Args:
             info (dict): yt_dlp 擷取的影片資訊。
-            preferred_langs (list[str]): 語言優先順序。
+            preferred_langs (Sequence[str]): 語言優先順序，預設為 _PREFERRED_LANGS_ORDERED。
 
         Returns:
-            tuple[str | None, str | None]: (字幕 URL, 格式)，若無字幕則皆為 None。
+            tuple[str | None, str | None, str | None]: (字幕 URL, 語言, 格式)，若無字幕則皆為 None。
         """
         try:
             # 先查找 subtitles 若不存在則使用 automatic_captions
             subs = info.get("subtitles") or info.get("automatic_captions") or {}
-            # 依照優先語言順序尋找可用字幕
+            # 依照優先語言順序尋找可用字幕，命中即回傳
             for lang in preferred_langs:
-                if lang in subs and subs[lang]:
-                    lang_subs = subs[lang]
-                    # 優先選擇 srt 格式
-                    for s in lang_subs:
-                        if s.get("ext") == "srt":
-                            return s.get("url"), lang
-
-            # 若無偏好srt，取第一個可用字幕
-            if subs:
-                lang, subtitles = next(iter(subs.items()))
-                for s in subtitles:
-                    if s.get("ext") == "srt":
-                        return s.get("url"), lang
+                fmt = _pick_subtitle_format(subs.get(lang))
+                if fmt:
+                    return fmt["url"], lang, fmt.get("ext")
+
+            # 無偏好語言時，取第一個有可用格式的語言
+            for lang, fmts in subs.items():
+                fmt = _pick_subtitle_format(fmts)
+                if fmt:
+                    return fmt["url"], lang, fmt.get("ext")
         except Exception as e:
             logger.warning(f"字幕 URL 提取失敗: {e}")
 
         # 若無任何可用字幕，回傳 None
-        return None, None
+        return None, None, None
 
     def _run(self, video_id: str) -> VideoMetadata | None:
         """
@@ -230,7 +504,7 @@ class YoutubeMetadataTool(BaseTool):
             2. 執行影片資訊擷取，獲取完整的 metadata
             3. 智慧字幕可用性檢測與品質評估
             4. 根據語言偏好選擇最佳字幕來源
-            5. 下載並處理字幕內容（SRT 格式）
+            5. 下載並處理字幕內容（統一為 SRT/VTT 文字）
             6. 日期格式標準化與關鍵字處理
             7. 組裝完整的 VideoMetadata 物件
 
@@ -238,7 +512,7 @@ class YoutubeMetadataTool(BaseTool):
             - 反爬蟲機制: 使用多重 user-agent 與 player client 策略
             - 智慧重試: yt-dlp 內建的指數退縮重試機制
             - 字幕優先級: zh-TW > zh-Hant > zh-CN > zh-Hans > en
-            - 格式偏好: 優先選擇 SRT 格式確保時間軸準確性
+            - 格式偏好: json3 > vtt > srt，json3 解析後轉為 SRT
             - 記憶體優化: 僅下載必要資訊，跳過實際影片檔案
 
         資料處理邏輯:
@@ -283,67 +557,87 @@ class YoutubeMetadataTool(BaseTool):
             if metadata and metadata.subtitles:
                 print(f"成功獲取影片: {metadata.title}")
         """
+        return _run_sync(self._arun(video_id))
+
+    async def _arun(self, video_id: str) -> VideoMetadata | None:
+        """
+        _run 的非同步版本
 
+        流程與 _run 相同，字幕下載改用共用的 aiohttp session，
+        適合在事件迴圈中同時處理多支影片。
+
+        Args:
+            video_id (str): YouTube 影片的 11 字元唯一識別碼
+
+        Returns:
+            VideoMetadata | None: 影片元數據，失敗時回傳 None
+        """
         url = f"https://www.youtube.com/watch?v={video_id}"  # 組合 YouTube 影片網址
-        ydl_opts = {
-            "skip_download": True,
-            "quiet": True,
-            "no_warnings": True,
-            "writesubtitles": False,
-            "writeautomaticsub": False,
-            "extract_flat": False,
-            # 避免 YouTube 反爬蟲機制 - 更新配置
-            "user_agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            "extractor_args": {
-                "youtube": {
-                    "player_client": ["android", "web"],
-                    "player_skip": ["configs", "webpage"],
-                }
-            },
-            "noplaylist": True,
-            # 不指定格式，讓 yt-dlp 自己選擇
-        }
         try:
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                info = ydl.extract_info(url, download=False)
+            # yt-dlp 為同步阻塞呼叫，交由專用執行緒池執行以免卡住事件迴圈
+            loop = asyncio.get_running_loop()
+            info = await loop.run_in_executor(
+                _YDL_POOL, _extract_info_cached, video_id, url
+            )
 
             # 先檢測字幕可用性
             subtitle_availability = self._detect_subtitle_availability(info)
-            logger.info(f"字幕可用性檢測結果: {subtitle_availability.model_dump()}")
+            # 以 %s 延遲格式化，日誌等級未啟用時不需序列化模型
+            logger.info("字幕可用性檢測結果: %s", subtitle_availability)
 
-            # 設定字幕語言優先順序
-            preferred_langs = ["zh-TW", "zh-Hant", "zh-CN", "zh-Hans", "en"]
-            subtitle_url, subtitle_lang = self._extract_subtitle_url(
-                info, preferred_langs
-            )
+            # 依字幕語言優先順序選擇字幕
+            subtitle_url, subtitle_lang, subtitle_ext = self._extract_subtitle_url(info)
 
             subtitles_text = None
+            subtitle_key = f"{video_id}:{subtitle_lang}"
+            download_task = None
             if subtitle_url:
-                try:
-                    # 下載字幕內容，失敗則記錄警告
-                    logger.info(f"正在下載字幕: {subtitle_url}")
-                    resp = requests.get(subtitle_url, timeout=10)
-                    resp.raise_for_status()
-                    subtitles_text = resp.text
-                    # 更新字幕可用性中的選擇語言
+                subtitles_text = _cache_get(_SUBTITLE_CACHE, subtitle_key)
+                if subtitles_text is not None:
                     subtitle_availability.selected_lang = subtitle_lang
-                except Exception as e:
-                    logger.warning(f"字幕下載或解析失敗: {e}")
+                else:
+                    # 立即開始下載字幕，下方整理其餘欄位的同時進行網路 I/O
+                    logger.info(f"正在下載字幕: {subtitle_url}")
+                    download_task = asyncio.create_task(
+                        _download_subtitle(subtitle_url, subtitle_ext)
+                    )
             else:
                 logger.info(f"影片 {video_id} 無可用字幕或自動字幕")
 
-            # 轉換日期格式，yt_dlp 回傳格式為 YYYYMMDD
-            publish_date = None
-            if info.get("upload_date"):
-                try:
-                    publish_date = datetime.strptime(info["upload_date"], "%Y%m%d")
-                except Exception as e:
-                    print(f"日期格式解析失敗: {e}")
-
-            # 關鍵字欄位，優先 tags，否則 categories
-            keywords = info.get("tags") or info.get("categories") or None
-            if keywords and not isinstance(keywords, list):
-                keywords = [str(keywords)]
+            try:
+                # 轉換日期格式，yt_dlp 回傳格式為 YYYYMMDD
+                publish_date = None
+                upload_date = info.get("upload_date")
+                if upload_date:
+                    publish_date = _parse_yyyymmdd(upload_date)
+                    if publish_date is None:
+                        logger.warning(f"日期格式解析失敗: {upload_date!r}")
+
+                # 關鍵字欄位，優先 tags，否則 categories
+                keywords = _coerce_keywords(info.get("tags") or info.get("categories"))
+
+                if download_task is not None:
+                    try:
+                        subtitles_text = await download_task
+                        # 更新字幕可用性中的選擇語言
+                        subtitle_availability.selected_lang = subtitle_lang
+                        _cache_set(
+                            _SUBTITLE_CACHE,
+                            subtitle_key,
+                            subtitles_text,
+                            _SUBTITLE_CACHE_TTL,
+                        )
+                    except Exception as e:
+                        # 下載失敗則記錄警告，其餘元數據照常回傳
+                        logger.warning(f"字幕下載或解析失敗: {e}")
+            finally:
+                # 整理欄位途中發生例外時取消尚在進行的下載，避免留下無人等待的任務；
+                # 已失敗的下載則取出例外，避免 "Task exception was never retrieved"
+                if download_task is not None:
+                    if not download_task.done():
+                        download_task.cancel()
+                    elif not download_task.cancelled():
+                        download_task.exception()
 
             # 填充 VideoMetadata (根據 models.py)
             metadata = VideoMetadata(
@@ -369,6 +663,31 @@ class YoutubeMetadataTool(BaseTool):
             logger.error(f"yt_dlp error for video {video_id}: {str(e)}")
             return None
 
+    async def arun_many(self, video_ids: list[str]) -> list[VideoMetadata | None]:
+        """
+        並行擷取多支影片的元數據
+
+        以 MAX_CONCURRENCY 限制同時處理的影片數，所有影片共用同一個 aiohttp session，
+        總耗時約為單支影片耗時而非逐支累加。
+
+        Args:
+            video_ids (list[str]): YouTube 影片 ID 列表
+
+        Returns:
+            list[VideoMetadata | None]: 與輸入順序對應的結果，失敗者為 None
+        """
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENCY)
+
+        async def fetch(video_id: str) -> VideoMetadata | None:
+            async with semaphore:
+                return await self._arun(video_id)
+
+        return await asyncio.gather(*(fetch(v) for v in video_ids))
+
+    def run_many(self, video_ids: list[str]) -> list[VideoMetadata | None]:
+        """arun_many 的同步版本，供非 async 呼叫端使用"""
+        return _run_sync(self.arun_many(video_ids))
+
 
 # 使用範例：直接執行此檔案時會執行以下程式
 if __name__ == "__main__":
@@ -377,9 +696,7 @@ if __name__ == "__main__":
     video_id = "VF1HMYD95aw"  # 替換為實際的 YouTube 影片 ID
     metadata = tool._run(video_id)
     if metadata:
-        # Pydantic v2 不再支援 json() 的 ensure_ascii/indent 參數，需用 json.dumps
-        print(
-            json.dumps(metadata.model_dump(), ensure_ascii=False, indent=2, default=str)
-        )
+        # orjson 原生支援 datetime 並輸出 UTF-8，不需 ensure_ascii/default=str
+        print(orjson.dumps(metadata.model_dump(), option=orjson.OPT_INDENT_2).decode())
     else:
         print(None)
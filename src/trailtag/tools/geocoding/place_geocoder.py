@@ -1,15 +1,64 @@
+import asyncio
+import hashlib
 import threading
 import time
+import weakref
+from collections import OrderedDict
 from src.api.core.logger_config import get_logger
+from src.common.disk_cache import get_disk_cache
+from src.common.http_utils import DEFAULT_HEADERS, close_loop_sessions
 import os
 from crewai.tools import BaseTool
-from typing import Type
+from typing import ClassVar, Type
 from pydantic import BaseModel, Field
-import requests
+import aiohttp
+import orjson
+import urllib3
+from urllib3.exceptions import MaxRetryError, ProtocolError
+from urllib3.exceptions import TimeoutError as Urllib3TimeoutError
+from urllib3.util.retry import Retry
 
 # 設定 logger 以便記錄錯誤與警告訊息
 logger = get_logger(__name__)
 
+# 模組層級共用的 urllib3 連線池：重用 keep-alive 連線省去每次查詢的 TCP/TLS 握手，
+# 並對 429/5xx 以指數退縮自動重試；回應支援 brotli 壓縮以減少傳輸量。
+# 直接使用 urllib3 以省去 requests 每次請求的額外封裝開銷
+_POOL = urllib3.PoolManager(
+    num_pools=4,
+    maxsize=32,
+    headers=DEFAULT_HEADERS,
+    retries=Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=[429, 500, 502, 503, 504],
+    ),
+)
+_HTTP_TIMEOUT = urllib3.Timeout(connect=3, read=10)
+
+# 非同步批次查詢使用的 aiohttp session，依事件迴圈分別建立
+_aio_sessions: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+GEOCODE_URL = "https://maps.googleapis.com/maps/api/geocode/json"
+
+
+def _get_aio_session() -> aiohttp.ClientSession:
+    """取得目前事件迴圈共用的 aiohttp session"""
+    loop = asyncio.get_running_loop()
+    session = _aio_sessions.get(loop)
+    if session is None or session.closed:
+        session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=32, ttl_dns_cache=300),
+            headers=DEFAULT_HEADERS,
+        )
+        _aio_sessions[loop] = session
+    return session
+
+
+async def close_sessions() -> None:
+    """關閉所有事件迴圈上共用的 aiohttp session，供應用程式關閉時呼叫"""
+    await close_loop_sessions(_aio_sessions)
+
 
 class TokenBucket:
     """
@@ -91,16 +140,75 @@ class TokenBucket:
         時間精度:
             使用 time.monotonic() 避免系統時間調整影響
         """
+        return self._try_consume(tokens) == 0.0
+
+    def _try_consume(self, tokens: int) -> float:
+        """
+        補充 Token 後嘗試扣除
+
+        Returns:
+            float: 0.0 表示已成功扣除；否則為補足缺額所需的等待秒數
+        """
+        # 在鎖外取得時間，縮短臨界區；其他執行緒可能已用較新的時間更新，
+        # 因此 elapsed 不得為負，時間戳也只向前推進
+        now = time.monotonic()
         with self.lock:
-            now = time.monotonic()
             elapsed = now - self.timestamp
-            # 補充 token，確保不超過 burst 上限
-            self.tokens = min(self.burst, self.tokens + elapsed * self.rate)
-            self.timestamp = now
+            if elapsed > 0:
+                # 補充 token，確保不超過 burst 上限
+                self.tokens = min(self.burst, self.tokens + elapsed * self.rate)
+                self.timestamp = now
             if self.tokens >= tokens:
                 self.tokens -= tokens
+                return 0.0
+            return (tokens - self.tokens) / self.rate
+
+    def acquire(self, tokens: int = 1, timeout: float | None = None) -> bool:
+        """
+        阻塞等待直到取得指定數量的 Token
+
+        Token 不足時依缺額與補充速率計算精確的等待時間並 sleep，
+        等待期間不持有鎖，避免請求因暫時缺少 Token 而被丟棄。
+
+        Args:
+            tokens (int): 需要消耗的 Token 數量
+            timeout (float | None): 最長等待秒數，None 表示無限等待
+
+        Returns:
+            bool: True 表示已取得 Token；False 表示在 timeout 內無法取得
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            wait = self._try_consume(tokens)
+            if wait == 0.0:
                 return True
-            return False
+            if deadline is not None and time.monotonic() + wait > deadline:
+                return False
+            time.sleep(wait)
+
+    async def acquire_async(
+        self, tokens: int = 1, timeout: float | None = None
+    ) -> bool:
+        """
+        acquire 的非同步版本
+
+        以 await asyncio.sleep 等待 Token 補充，不會阻塞事件迴圈或其他執行緒。
+
+        Args:
+            tokens (int): 需要消耗的 Token 數量
+            timeout (float | None): 最長等待秒數，None 表示無限等待
+
+        Returns:
+            bool: True 表示已取得 Token；False 表示在 timeout 內無法取得
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            wait = self._try_consume(tokens)
+            if wait == 0.0:
+                return True
+            if deadline is not None and time.monotonic() + wait > deadline:
+                return False
+            await asyncio.sleep(wait)
 
 
 # 模組層級的 Token Bucket 實例
@@ -108,6 +216,130 @@ class TokenBucket:
 # 這個設定符合 Google Geocoding API 的免費額度限制
 _token_bucket = TokenBucket(rate=5, burst=10)
 
+# 模組層級的地理編碼結果 LRU 快取
+# 鍵為正規化後的地址字串 (見 _normalize_address)；值為座標 dict，或 None 表示 Google 查無結果 (ZERO_RESULTS)
+# API 錯誤、網路錯誤等暫時性失敗不寫入快取，確保之後會重新查詢
+_GEO_CACHE_MAXSIZE = 4096
+_geo_cache: "OrderedDict[str, dict | None]" = OrderedDict()
+_geo_cache_lock = threading.Lock()
+_CACHE_MISS = object()
+
+
+def _geo_cache_get(key: str):
+    """查詢快取，未命中時回傳 _CACHE_MISS"""
+    with _geo_cache_lock:
+        value = _geo_cache.get(key, _CACHE_MISS)
+        if value is not _CACHE_MISS:
+            _geo_cache.move_to_end(key)
+        return value
+
+
+def _geo_cache_put(key: str, value: dict | None) -> None:
+    """寫入快取，超過容量時淘汰最久未使用的項目"""
+    with _geo_cache_lock:
+        _geo_cache[key] = value
+        _geo_cache.move_to_end(key)
+        if len(_geo_cache) > _GEO_CACHE_MAXSIZE:
+            _geo_cache.popitem(last=False)
+
+
+# 持久化地理編碼快取 (SQLite)，程序重啟後仍可重用先前的查詢結果
+# 成功結果保留 30 天；查無結果僅保留 1 天，讓資料更新後能重新查得；首次查詢時才開啟
+_GEO_DISK_TTL = 30 * 86400
+_GEO_DISK_NEGATIVE_TTL = 86400
+_GEO_DISK_NAME = "geocode"
+
+
+def _geo_disk_key(key: str) -> str:
+    """以正規化地址的 SHA-1 作為磁碟快取鍵值"""
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()
+
+
+def _geo_disk_get(key: str):
+    """查詢磁碟快取，未命中或快取不可用時回傳 _CACHE_MISS"""
+    geo_disk = get_disk_cache(_GEO_DISK_NAME)
+    if geo_disk is None:
+        return _CACHE_MISS
+    try:
+        record = geo_disk.get(_geo_disk_key(key))
+    except Exception as e:
+        logger.warning(f"讀取地理編碼磁碟快取失敗: {e}")
+        return _CACHE_MISS
+    if record is None:
+        return _CACHE_MISS
+    if record.get("status") == "OK":
+        return {"lat": record["lat"], "lng": record["lng"]}
+    return None
+
+
+def _geo_disk_put(key: str, status: str, coordinates: dict | None) -> None:
+    """寫入磁碟快取，非 OK 狀態使用較短的存活時間"""
+    geo_disk = get_disk_cache(_GEO_DISK_NAME)
+    if geo_disk is None:
+        return
+    record = {"status": status, "ts": time.time()}
+    if coordinates is not None:
+        record.update(coordinates)
+    expire = _GEO_DISK_TTL if status == "OK" else _GEO_DISK_NEGATIVE_TTL
+    try:
+        geo_disk.set(_geo_disk_key(key), record, expire=expire)
+    except Exception as e:
+        logger.warning(f"寫入地理編碼磁碟快取失敗: {e}")
+
+
+def _normalize_address(country: str, city: str, place: str) -> str:
+    """
+    產生快取用的正規化地址
+
+    合併多餘空白並轉為小寫，讓空白或大小寫不同的相同地點命中同一快取鍵值。
+    """
+    return " ".join(f"{place},{city},{country}".split()).lower()
+
+
+def _geo_cache_lookup(key: str):
+    """依序查詢記憶體與磁碟快取，磁碟命中時回填記憶體快取；未命中回傳 _CACHE_MISS"""
+    cached = _geo_cache_get(key)
+    if cached is _CACHE_MISS:
+        cached = _geo_disk_get(key)
+        if cached is not _CACHE_MISS:
+            _geo_cache_put(key, cached)
+    return cached
+
+
+def _handle_geocode_response(data: dict, cache_key: str, address: str) -> dict | None:
+    """
+    解析 Google Geocoding API 回應並寫入快取
+
+    同步與非同步查詢共用的結果處理邏輯。
+
+    Returns:
+        dict | None: 成功時為 {'lat': float, 'lng': float}，否則為 None
+    """
+    # 詳細的 API 回應日誌 (只在需要時啟用)
+    # logger.debug(f"Google Geocoding API 回應: {json.dumps(data, ensure_ascii=False, indent=2)}")
+
+    # 結果狀態驗證與座標提取
+    status = data.get("status")
+    if status == "OK" and data.get("results"):
+        # 提取第一個 (最佳) 匹配結果的座標
+        location = data["results"][0]["geometry"]["location"]
+        coordinates = {"lat": location["lat"], "lng": location["lng"]}
+        logger.info(f"地理編碼成功: {address} -> {coordinates}")
+        _geo_cache_put(cache_key, dict(coordinates))
+        _geo_disk_put(cache_key, status, coordinates)
+        return coordinates
+
+    # 查無結果為確定性結果，快取起來避免重複查詢無法定位的地點
+    if status == "ZERO_RESULTS":
+        _geo_cache_put(cache_key, None)
+        _geo_disk_put(cache_key, status, None)
+    # 無法找到匹配結果或其他 API 錯誤
+    logger.warning(
+        f"地理編碼失敗: {status} - {address}"
+        + (f" ({data.get('error_message', '')})" if data.get("error_message") else "")
+    )
+    return None
+
 
 class PlaceGeocodeToolInput(BaseModel):
     """
@@ -184,6 +416,9 @@ class PlaceGeocodeTool(BaseTool):
     )
     args_schema: Type[BaseModel] = PlaceGeocodeToolInput
 
+    # 非同步批次查詢的最大並行數
+    MAX_CONCURRENCY: ClassVar[int] = 5
+
     def _run(self, country: str, city: str, place: str) -> dict | None:
         """
         地理編碼查詢的核心執行方法
@@ -192,9 +427,9 @@ class PlaceGeocodeTool(BaseTool):
         資料組裝和結果處理等完整步驟。
 
         執行流程:
-            1. Token Bucket 速率限制檢查
+            1. 記憶體 LRU 快取與磁碟快取查詢 (正規化地址，命中時直接回傳)
             2. Google API Key 驗證和環境變數讀取
-            3. 地址字串組裝 ("{place}, {city}, {country}")
+            3. Token Bucket 速率限制 (不足時等待補充)
             4. Google Geocoding API HTTP 請求
             5. 回應狀態驗證和結果提取
             6. 座標資料結構化輸出
@@ -217,34 +452,38 @@ class PlaceGeocodeTool(BaseTool):
                 失敗情況: None (並記錄具體錯誤資訊)
 
         錯誤處理:
-            - 速率限制: 記錄警告並直接回傳 None
             - API 密鑰缺失: 記錄錯誤並終止執行
             - 網路連線問題: 記錄錯誤和例外詳情
             - API 回應異常: 記錄狀態碼和地址資訊
 
         日誌等級:
-            - WARNING: 非致命問題 (速率限制、查無結果)
+            - WARNING: 非致命問題 (查無結果)
             - ERROR: 致命錯誤 (API 密鑰、網路失敗)
 
         效能注意:
             - 連線超時: 10 秒防止長時間等待
             - 速率控制: 自動限制請求頻率避免 API 濫用
         """
-        # Token Bucket 速率限制檢查 - 防止 API 濫用
-        if not _token_bucket.consume():
-            logger.warning("Geocoding API 速率限制觸發 - 當前請求被拒絕，請稍後再試")
-            return None
+        # 快取查詢 (記憶體 → 磁碟) - 命中時直接回傳，不消耗速率限制 token
+        cache_key = _normalize_address(country, city, place)
+        cached = _geo_cache_lookup(cache_key)
+        if cached is not _CACHE_MISS:
+            return dict(cached) if cached is not None else None
+
         # Google API Key 驗證 - 確保必要的認證資訊存在
         api_key = os.getenv("GOOGLE_API_KEY")
         if not api_key:
             logger.error("GOOGLE_API_KEY 環境變數未設定 - 無法執行地理編碼查詢")
             return None
+
         # 地址字串組裝 - 使用階層結構提高編碼精度
         address = f"{place}, {city}, {country}"
+
+        # Token Bucket 速率限制 - 僅實際呼叫 API 前消耗，Token 不足時等待補充
+        _token_bucket.acquire()
         logger.info(f"進行地理編碼查詢: {address}")
 
         # Google Geocoding API 請求參數
-        url = "https://maps.googleapis.com/maps/api/geocode/json"
         params = {
             "address": address,
             "key": api_key,
@@ -252,46 +491,103 @@ class PlaceGeocodeTool(BaseTool):
         }
         try:
             # 發送 HTTP GET 請求至 Google Geocoding API
-            resp = requests.get(url, params=params, timeout=10)
-            resp.raise_for_status()  # 檢查 HTTP 狀態碼
-            data = resp.json()
-
-            # 詳細的 API 回應日誌 (只在需要時啟用)
-            # logger.debug(f"Google Geocoding API 回應: {json.dumps(data, ensure_ascii=False, indent=2)}")
-
-            # 結果狀態驗證與座標提取
-            status = data.get("status")
-            if status == "OK" and data.get("results"):
-                # 提取第一個 (最佳) 匹配結果的座標
-                location = data["results"][0]["geometry"]["location"]
-                coordinates = {"lat": location["lat"], "lng": location["lng"]}
-                logger.info(f"地理編碼成功: {address} -> {coordinates}")
-                return coordinates
-            else:
-                # 無法找到匹配結果或其他 API 錯誤
-                logger.warning(
-                    f"地理編碼失敗: {status} - {address}"
-                    + (
-                        f" ({data.get('error_message', '')})"
-                        if data.get("error_message")
-                        else ""
-                    )
-                )
+            resp = _POOL.request(
+                "GET", GEOCODE_URL, fields=params, timeout=_HTTP_TIMEOUT
+            )
+            if resp.status >= 400:  # 檢查 HTTP 狀態碼
+                logger.error(f"HTTP 錯誤狀態碼: {resp.status} - {address}")
                 return None
-        except requests.exceptions.Timeout:
+            return _handle_geocode_response(orjson.loads(resp.data), cache_key, address)
+        except MaxRetryError as e:
+            # 重試次數用盡，依最後一次失敗原因分類記錄
+            if isinstance(e.reason, Urllib3TimeoutError):
+                logger.error(f"地理編碼請求超時 (10秒) - {address}")
+            elif isinstance(e.reason, urllib3.exceptions.ResponseError):
+                logger.error(f"HTTP 錯誤狀態碼: {e.reason} - {address}")
+            else:
+                logger.error("網路連線錯誤 - 無法連接 Google Geocoding API")
+            return None
+        except Urllib3TimeoutError:
             logger.error(f"地理編碼請求超時 (10秒) - {address}")
             return None
-        except requests.exceptions.ConnectionError:
+        except ProtocolError:
             logger.error("網路連線錯誤 - 無法連接 Google Geocoding API")
             return None
-        except requests.exceptions.HTTPError as e:
-            logger.error(f"HTTP 錯誤狀態碼: {e.response.status_code} - {address}")
-            return None
         except Exception as e:
             # 捕捉所有其他未預期的例外
             logger.error(f"地理編碼未知錯誤: {type(e).__name__}: {e} - {address}")
             return None
 
+    async def _arun(self, country: str, city: str, place: str) -> dict | None:
+        """
+        _run 的非同步版本
+
+        使用共用的 aiohttp session 發送請求，速率限制不足時以 await 等待 token
+        而非放棄查詢，適合在事件迴圈中大量並行呼叫。
+
+        Args:
+            country (str): 國家名稱
+            city (str): 城市名稱
+            place (str): 地點名稱
+
+        Returns:
+            dict | None: 地理座標資訊或錯誤時的 None
+        """
+        cache_key = _normalize_address(country, city, place)
+        cached = _geo_cache_lookup(cache_key)
+        if cached is not _CACHE_MISS:
+            return dict(cached) if cached is not None else None
+
+        api_key = os.getenv("GOOGLE_API_KEY")
+        if not api_key:
+            logger.error("GOOGLE_API_KEY 環境變數未設定 - 無法執行地理編碼查詢")
+            return None
+
+        address = f"{place}, {city}, {country}"
+        await _token_bucket.acquire_async()
+        logger.info(f"進行地理編碼查詢: {address}")
+        params = {"address": address, "key": api_key, "language": "zh-TW"}
+        try:
+            async with _get_aio_session().get(
+                GEOCODE_URL, params=params, timeout=aiohttp.ClientTimeout(total=10)
+            ) as resp:
+                resp.raise_for_status()
+                data = orjson.loads(await resp.read())
+            return _handle_geocode_response(data, cache_key, address)
+        except asyncio.TimeoutError:
+            logger.error(f"地理編碼請求超時 (10秒) - {address}")
+            return None
+        except aiohttp.ClientResponseError as e:
+            logger.error(f"HTTP 錯誤狀態碼: {e.status} - {address}")
+            return None
+        except aiohttp.ClientError:
+            logger.error("網路連線錯誤 - 無法連接 Google Geocoding API")
+            return None
+        except Exception as e:
+            logger.error(f"地理編碼未知錯誤: {type(e).__name__}: {e} - {address}")
+            return None
+
+    async def arun_many(self, triples: list[tuple[str, str, str]]) -> list[dict | None]:
+        """
+        並行查詢多個地點的座標
+
+        以 MAX_CONCURRENCY 限制同時進行的請求數 (與 Token Bucket 的 5 次/秒對齊)，
+        N 個地點約以 ceil(N/5) 波完成，而非逐一等待。
+
+        Args:
+            triples (list[tuple[str, str, str]]): (country, city, place) 列表
+
+        Returns:
+            list[dict | None]: 與輸入順序對應的座標結果
+        """
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENCY)
+
+        async def geocode(country: str, city: str, place: str) -> dict | None:
+            async with semaphore:
+                return await self._arun(country, city, place)
+
+        return await asyncio.gather(*(geocode(*t) for t in triples))
+
 
 # 測試和示範程式碼
 if __name__ == "__main__":
@@ -12,6 +12,11 @@
 
 from .subtitle_chunker import SubtitleChunker
 from .subtitle_compression import SubtitleCompressionTool
-from .token_counter import count_tokens
+from .token_counter import count_tokens, count_tokens_many
 
-__all__ = ["SubtitleChunker", "SubtitleCompressionTool", "count_tokens"]
+__all__ = [
+    "SubtitleChunker",
+    "SubtitleCompressionTool",
+    "count_tokens",
+    "count_tokens_many",
+]
@@ -12,14 +12,40 @@
 """
 
 import re
-from typing import List, Dict, Any
+from itertools import chain
+from typing import Dict, Iterable, List, Any
 from dataclasses import dataclass
 from enum import Enum
 import tiktoken
 from src.api.core.logger_config import get_logger
+from .token_counter import get_encoding
 
 logger = get_logger(__name__)
 
+# 預先編譯的正規表示式（避免迴圈中每次呼叫 re 模組時的快取查找）
+# 單一字幕區塊：時間軸行 (允許 VTT cue 設定) + 其後直到空行、下一個時間軸或結尾的文字
+_CUE_RE = re.compile(
+    r"(\d{2}):(\d{2}):(\d{2})[.,](\d{3})\s*-->\s*(\d{2}):(\d{2}):(\d{2})[.,](\d{3})[^\n]*"
+    r"(.*?)(?=\n\s*\n|\n\s*\d+\s*\n[^\n]*-->|\n[^\n]*-->|\Z)",
+    re.S,
+)
+# HTML 標籤與樣式標籤一次移除；字元類別排除開頭符號與換行，
+# 未閉合的 "<" 或 "{" 只會向後掃描到下一個開頭符號或行尾即失敗，不會跨行回溯
+_TAG_RE = re.compile(r"<[^<>\n]+>|\{[^{}\n]+\}")
+_WORD_RE = re.compile(r"\b\w+\b")
+_SENT_END_RE = re.compile(r"[.!?。！？]\s*")
+_STRONG_BREAK_RE = re.compile(r"[.!?。！？]\s*(?=[A-Z\u4e00-\u9fff])")
+_WEAK_BREAK_RE = re.compile(r"[,;，；]\s*")
+
+# 句尾標點集合，分割點評分以字串操作判斷，不需正規表示式
+_SENT_END_CHARS = frozenset(".!?。！？")
+
+
+def _starts_sentence(text: str) -> bool:
+    """判斷文字是否以英文大寫字母或 CJK 漢字開頭（強分隔的下一句開頭）"""
+    first = text.lstrip()[:1]
+    return "A" <= first <= "Z" or "\u4e00" <= first <= "\u9fff"
+
 
 class ChunkStrategy(str, Enum):
     """分段策略枚舉"""
@@ -30,7 +56,7 @@ class ChunkStrategy(str, Enum):
     SIMPLE = "simple"  # 簡單字數分段
 
 
-@dataclass
+@dataclass(slots=True)
 class SubtitleChunk:
     """字幕分段資料結構"""
 
@@ -49,7 +75,7 @@ class SubtitleChunk:
             self.metadata = {}
 
 
-@dataclass
+@dataclass(slots=True)
 class SubtitleEntry:
     """單一字幕條目"""
 
@@ -58,6 +84,8 @@ class SubtitleEntry:
     end_time: float
     text: str
     duration: float = None
+    token_count: int = None  # 快取的 Token 數，由 SubtitleChunker 延遲計算
+    ts_prefix: str = None  # 快取的 "[start --> end]" 時間戳前綴
 
     def __post_init__(self):
         if self.duration is None:
@@ -92,17 +120,20 @@ class SubtitleChunker:
         self.min_tokens = min_tokens
         self.overlap_ratio = max(0.0, min(0.3, overlap_ratio))
 
-        # 初始化 tiktoken 編碼器
+        # 初始化 tiktoken 編碼器（依模型共用，避免重複建立 BPE）
         try:
-            self.encoding = tiktoken.encoding_for_model(model)
+            self.encoding = get_encoding(model)
         except KeyError:
             logger.warning(f"模型 {model} 不支援，使用 cl100k_base 編碼")
             self.encoding = tiktoken.get_encoding("cl100k_base")
 
-        # 語句分隔符號和標點符號
-        self.sentence_endings = r"[.!?。！？]\s*"
-        self.strong_breaks = r"[.!?。！？]\s*(?=[A-Z\u4e00-\u9fff])"
-        self.weak_breaks = r"[,;，；]\s*"
+        # 語句分隔符號和標點符號（預編譯的 re.Pattern）
+        self.sentence_endings = _SENT_END_RE
+        self.strong_breaks = _STRONG_BREAK_RE
+        self.weak_breaks = _WEAK_BREAK_RE
+
+        # 分段內容中每個條目的時間戳前綴與換行所佔 Token 數（格式固定，只需計算一次）
+        self._timestamp_tokens = self.count_tokens("[00:00:00.000 --> 00:00:00.000] \n")
 
         logger.info(
             f"SubtitleChunker 初始化完成: max_tokens={max_tokens}, model={model}"
@@ -117,6 +148,44 @@ class SubtitleChunker:
             # 備用估算：平均每個字母約 0.25 tokens
             return int(len(text) * 0.25)
 
+    @staticmethod
+    def approx_tokens(text: str) -> int:
+        """
+        以字元數快速估算 Token 數（不呼叫 BPE）
+
+        約每 4 個字元 1 個 Token，再以空白數修正英文斷詞；誤差約在數個百分點內，
+        只用於分割點評分等不需精確值的情境，分段上限檢查與最終統計仍使用精確計數。
+        """
+        return max(1, len(text) // 4 + text.count(" ") // 2)
+
+    def entry_tokens(self, entry: SubtitleEntry) -> int:
+        """取得字幕條目的 Token 數，首次計算後快取在條目上"""
+        if entry.token_count is None:
+            entry.token_count = self.count_tokens(entry.text)
+        return entry.token_count
+
+    def precompute_token_counts(self, entries: List[SubtitleEntry]) -> None:
+        """
+        預先計算所有條目的 Token 數
+
+        字幕條目多為短句，encode_ordinary_batch 的執行緒池會為每條建立一個 future，
+        排程開銷遠大於編碼本身，因此逐條以 encode_ordinary 序列編碼；
+        重複的字幕文字（音樂提示、講者標記等）只編碼一次。
+        """
+        counts: Dict[str, int] = {}
+        for entry in entries:
+            if entry.token_count is not None:
+                continue
+            count = counts.get(entry.text)
+            if count is None:
+                try:
+                    count = len(self.encoding.encode_ordinary(entry.text))
+                except Exception as e:
+                    logger.warning(f"Token 計算失敗，改用一般計算: {e}")
+                    count = self.count_tokens(entry.text)
+                counts[entry.text] = count
+            entry.token_count = count
+
     def parse_subtitles(self, subtitle_text: str) -> List[SubtitleEntry]:
         """
         解析字幕文字為結構化格式
@@ -131,70 +200,32 @@ class SubtitleChunker:
         entries = []
 
         try:
-            # 預處理：移除多餘的空白行
-            lines = [line.strip() for line in subtitle_text.split("\n") if line.strip()]
-
-            i = 0
-            index = 0
-
-            while i < len(lines):
-                # 跳過序號行（純數字）
-                if lines[i].isdigit():
-                    i += 1
-                    if i >= len(lines):
-                        break
-
-                # 解析時間戳
-                time_line = lines[i]
-                time_match = re.search(
-                    r"(\d{2}):(\d{2}):(\d{2})[.,](\d{3})\s*-->\s*(\d{2}):(\d{2}):(\d{2})[.,](\d{3})",
-                    time_line,
-                )
-
-                if time_match:
-                    # 計算開始和結束時間（秒）
-                    start_h, start_m, start_s, start_ms = map(
-                        int, time_match.groups()[:4]
+            # 單次 finditer 掃描整份字幕，逐區塊取出時間軸與文字
+            for match in _CUE_RE.finditer(subtitle_text):
+                groups = match.groups()
+                # 以整數毫秒計算後只做一次除法，避免逐欄位浮點運算
+                sh, sm, ss, sms, eh, em, es, ems = map(int, groups[:8])
+                start_time = (((sh * 60 + sm) * 60 + ss) * 1000 + sms) / 1000
+                end_time = (((eh * 60 + em) * 60 + es) * 1000 + ems) / 1000
+
+                # 整段文字一次清理 HTML 與樣式標籤後合併為單行文字
+                text_content = " ".join(
+                    line
+                    for line in (
+                        raw_line.strip()
+                        for raw_line in _TAG_RE.sub("", groups[8]).split("\n")
                     )
-                    end_h, end_m, end_s, end_ms = map(int, time_match.groups()[4:])
-
-                    start_time = (
-                        start_h * 3600 + start_m * 60 + start_s + start_ms / 1000
+                    if line
+                )
+                if text_content:
+                    entries.append(
+                        SubtitleEntry(
+                            index=len(entries),
+                            start_time=start_time,
+                            end_time=end_time,
+                            text=text_content,
+                        )
                     )
-                    end_time = end_h * 3600 + end_m * 60 + end_s + end_ms / 1000
-
-                    i += 1
-
-                    # 收集文字內容
-                    text_lines = []
-                    while (
-                        i < len(lines)
-                        and not lines[i].isdigit()
-                        and "-->" not in lines[i]
-                    ):
-                        # 清理 HTML 標籤和格式
-                        clean_text = re.sub(r"<[^>]+>", "", lines[i])
-                        clean_text = re.sub(
-                            r"\{[^}]+\}", "", clean_text
-                        )  # 移除樣式標籤
-                        if clean_text:
-                            text_lines.append(clean_text)
-                        i += 1
-
-                    if text_lines:
-                        text_content = " ".join(text_lines).strip()
-                        if text_content:
-                            entries.append(
-                                SubtitleEntry(
-                                    index=index,
-                                    start_time=start_time,
-                                    end_time=end_time,
-                                    text=text_content,
-                                )
-                            )
-                            index += 1
-                else:
-                    i += 1
 
             logger.info(f"解析字幕完成: {len(entries)} 個條目")
             return entries
@@ -260,7 +291,7 @@ class SubtitleChunker:
         current_tokens = 0
 
         for i, entry in enumerate(entries):
-            entry_tokens = self.count_tokens(entry.text)
+            entry_tokens = self.entry_tokens(entry)
 
             # 檢查是否需要開始新分段
             if current_tokens + entry_tokens > self.max_tokens and current_chunk:
@@ -268,10 +299,12 @@ class SubtitleChunker:
                 split_point = self._find_semantic_split_point(current_chunk)
 
                 if split_point > 0:
-                    # 在語意邊界分割
-                    chunks.append(current_chunk[:split_point])
-                    current_chunk = current_chunk[split_point:] + [entry]
-                    current_tokens = self._get_chunk_tokens(current_chunk)
+                    # 在語意邊界分割；剩餘條目就地保留在 current_chunk，不另建新列表
+                    head = current_chunk[:split_point]
+                    chunks.append(head)
+                    del current_chunk[:split_point]
+                    current_chunk.append(entry)
+                    current_tokens += entry_tokens - self._get_chunk_tokens(head)
                 else:
                     # 無法找到語意邊界，強制分割
                     chunks.append(current_chunk)
@@ -321,30 +354,43 @@ class SubtitleChunker:
         if len(entries) <= 1:
             return 0
 
-        # 計算每個位置的分割分數
-        scores = []
-        for i in range(1, len(entries)):
-            score = self._calculate_split_score(entries, i)
-            scores.append((score, i))
-
-        # 選擇分數最高的分割點
-        if scores:
-            scores.sort(reverse=True)
-            best_score, best_index = scores[0]
-
-            # 確保分割後的兩部分都有最小 Token 數
-            if (
-                self._get_chunk_tokens(entries[:best_index]) >= self.min_tokens
-                and self._get_chunk_tokens(entries[best_index:]) >= self.min_tokens
-            ):
-                return best_index
+        # Token 前綴和：任一分割點左右兩側的 Token 數皆可 O(1) 取得
+        prefix = [0]
+        for entry in entries:
+            prefix.append(prefix[-1] + self.entry_tokens(entry))
+        total_tokens = prefix[-1]
+
+        # 兩側皆需達最小 Token 數；前綴和單調遞增，合法分割點為連續區間
+        candidates = [
+            i
+            for i in range(1, len(entries))
+            if prefix[i] >= self.min_tokens
+            and total_tokens - prefix[i] >= self.min_tokens
+        ]
+        if not candidates:
+            return 0
 
-        return 0
+        # 於合法分割點中選擇分數最高者（同分取較後的位置），
+        # 最高分位置不符合最小 Token 限制時自然退而取次佳者
+        _, best_index = max(
+            (self._calculate_split_score(entries, i, prefix), i) for i in candidates
+        )
+        return best_index
 
     def _calculate_split_score(
-        self, entries: List[SubtitleEntry], split_index: int
+        self,
+        entries: List[SubtitleEntry],
+        split_index: int,
+        prefix: List[int] | None = None,
     ) -> float:
-        """計算分割點的分數"""
+        """
+        計算分割點的分數
+
+        Args:
+            entries: 字幕條目列表
+            split_index: 分割點索引
+            prefix: entries 的 Token 前綴和（長度 len(entries) + 1），未提供時即時計算
+        """
         if split_index <= 0 or split_index >= len(entries):
             return 0.0
 
@@ -361,15 +407,17 @@ class SubtitleChunker:
         elif time_gap > 0.5:  # 大於0.5秒
             score += 10.0
 
-        # 句子結尾分數
-        if re.search(self.strong_breaks, prev_entry.text):
-            score += 25.0
-        elif re.search(self.sentence_endings, prev_entry.text):
-            score += 15.0
-
-        # Token 平衡分數
-        left_tokens = self._get_chunk_tokens(entries[:split_index])
-        right_tokens = self._get_chunk_tokens(entries[split_index:])
+        # 句子結尾分數：前一條以句尾標點結束；下一條以新句開頭時視為強分隔
+        if prev_entry.text.rstrip()[-1:] in _SENT_END_CHARS:
+            score += 25.0 if _starts_sentence(curr_entry.text) else 15.0
+
+        # Token 平衡分數（僅用於評分，允許估算值）
+        if prefix is not None:
+            left_tokens = prefix[split_index]
+            right_tokens = prefix[-1] - left_tokens
+        else:
+            left_tokens = self._get_chunk_tokens(entries[:split_index], exact=False)
+            right_tokens = self._get_chunk_tokens(entries[split_index:], exact=False)
         total_tokens = left_tokens + right_tokens
 
         if total_tokens > 0:
@@ -378,29 +426,60 @@ class SubtitleChunker:
 
         return score
 
-    def _get_chunk_tokens(self, entries: List[SubtitleEntry]) -> int:
-        """計算分段的總 Token 數"""
-        return sum(self.count_tokens(entry.text) for entry in entries)
+    def _get_chunk_tokens(
+        self, entries: Iterable[SubtitleEntry], exact: bool = True
+    ) -> int:
+        """
+        計算分段的總 Token 數
+
+        Args:
+            entries: 字幕條目列表
+            exact: False 時尚未計算過的條目改用 approx_tokens 估算，不觸發編碼
+        """
+        if exact:
+            return sum(self.entry_tokens(entry) for entry in entries)
+        return sum(
+            entry.token_count
+            if entry.token_count is not None
+            else self.approx_tokens(entry.text)
+            for entry in entries
+        )
 
     def create_chunk_object(
-        self, chunk_id: str, entries: List[SubtitleEntry], chunk_index: int
+        self,
+        chunk_id: str,
+        entries: List[SubtitleEntry],
+        chunk_index: int,
+        entry_tokens: int | None = None,
     ) -> SubtitleChunk:
-        """創建字幕分段物件"""
+        """
+        創建字幕分段物件
+
+        Args:
+            chunk_id: 分段 ID 前綴
+            entries: 字幕條目列表
+            chunk_index: 分段索引
+            entry_tokens: 呼叫端已算好的條目文字 Token 總數，提供時不再逐條累加
+        """
         if not entries:
             raise ValueError("空的字幕條目列表")
 
-        # 合併文字內容
+        # 合併文字內容，並以各條目快取的 Token 數累加統計，不再重新編碼整段內容
         content_parts = []
+        text_tokens = 0
+        word_count = 0
+        sentence_count = 0
         for entry in entries:
-            timestamp = f"[{self._format_time(entry.start_time)} --> {self._format_time(entry.end_time)}]"
-            content_parts.append(f"{timestamp} {entry.text}")
+            content_parts.append(f"{self._timestamp_prefix(entry)} {entry.text}")
+            if entry_tokens is None:
+                text_tokens += self.entry_tokens(entry)
+            word_count += len(_WORD_RE.findall(entry.text))
+            sentence_count += len(self.sentence_endings.findall(entry.text))
 
         content = "\n".join(content_parts)
-
-        # 計算統計資訊
-        token_count = self.count_tokens(content)
-        word_count = len(re.findall(r"\b\w+\b", content))
-        sentence_count = len(re.findall(self.sentence_endings, content))
+        if entry_tokens is not None:
+            text_tokens = entry_tokens
+        token_count = text_tokens + self._timestamp_tokens * len(entries)
 
         return SubtitleChunk(
             id=f"{chunk_id}_{chunk_index:03d}",
@@ -419,12 +498,17 @@ class SubtitleChunker:
             },
         )
 
+    def _timestamp_prefix(self, entry: SubtitleEntry) -> str:
+        """取得條目的時間戳前綴，首次格式化後快取（重疊分段會重複使用同一條目）"""
+        if entry.ts_prefix is None:
+            entry.ts_prefix = f"[{self._format_time(entry.start_time)} --> {self._format_time(entry.end_time)}]"
+        return entry.ts_prefix
+
     def _format_time(self, seconds: float) -> str:
         """格式化時間為 HH:MM:SS.mmm"""
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        secs = seconds % 60
-        return f"{hours:02d}:{minutes:02d}:{secs:06.3f}"
+        hours, rem = divmod(seconds, 3600)
+        minutes, secs = divmod(rem, 60)
+        return f"{int(hours):02d}:{int(minutes):02d}:{secs:06.3f}"
 
     def chunk_subtitles(
         self,
@@ -456,12 +540,15 @@ class SubtitleChunker:
             if not entries:
                 logger.warning("無法解析字幕內容")
                 return []
+            self.precompute_token_counts(entries)
 
             # 檢查是否需要分割
             total_tokens = self._get_chunk_tokens(entries)
             if total_tokens <= self.max_tokens:
                 logger.info(f"字幕內容較短 ({total_tokens} tokens)，不需要分割")
-                chunk = self.create_chunk_object(video_id, entries, 0)
+                chunk = self.create_chunk_object(
+                    video_id, entries, 0, entry_tokens=total_tokens
+                )
                 return [chunk]
 
             # 執行分割策略
@@ -505,7 +592,7 @@ class SubtitleChunker:
         current_tokens = 0
 
         for entry in entries:
-            entry_tokens = self.count_tokens(entry.text)
+            entry_tokens = self.entry_tokens(entry)
 
             if current_tokens + entry_tokens > self.max_tokens and current_chunk:
                 chunks.append(current_chunk)
@@ -537,13 +624,13 @@ class SubtitleChunker:
             overlap_size = max(1, int(len(prev_chunk) * self.overlap_ratio))
             overlap_entries = prev_chunk[-overlap_size:]
 
-            # 創建包含重疊的新分段
-            combined_entries = overlap_entries + curr_chunk
-
-            # 確保不超過 Token 限制
-            if self._get_chunk_tokens(combined_entries) <= self.max_tokens:
+            # 確保不超過 Token 限制；通過檢查後才建立包含重疊的新分段列表
+            if (
+                self._get_chunk_tokens(chain(overlap_entries, curr_chunk))
+                <= self.max_tokens
+            ):
                 overlapped_chunk = self.create_chunk_object(
-                    chunks[i].id.rsplit("_", 1)[0], combined_entries, i
+                    chunks[i].id.rsplit("_", 1)[0], [*overlap_entries, *curr_chunk], i
                 )
                 overlapped_chunk.metadata["has_overlap"] = True
                 overlapped_chunk.metadata["overlap_entries"] = len(overlap_entries)
@@ -604,12 +691,22 @@ class SubtitleChunker:
             return "\n".join(results)
 
 
+# 依設定快取的分割器實例；分割器本身不保存逐次呼叫的狀態，可安全共用
+_CHUNKER_CACHE: Dict[tuple, SubtitleChunker] = {}
+
+
 # 工廠函數
 def create_subtitle_chunker(
     max_tokens: int = 3000, model: str = "gpt-4o-mini"
 ) -> SubtitleChunker:
-    """創建字幕分割器實例"""
-    return SubtitleChunker(max_tokens=max_tokens, model=model)
+    """取得字幕分割器實例，相同設定重用同一個實例"""
+    key = (max_tokens, model)
+    chunker = _CHUNKER_CACHE.get(key)
+    if chunker is None:
+        chunker = _CHUNKER_CACHE.setdefault(
+            key, SubtitleChunker(max_tokens=max_tokens, model=model)
+        )
+    return chunker
 
 
 # 便捷函數
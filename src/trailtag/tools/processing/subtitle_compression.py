@@ -4,7 +4,7 @@
 降低後續主題/地點摘要任務的 token 消耗，同時最大化地點與時間語境的留存。
 
 設計目標 (Simplified version of earlier proposal):
-1. 粗估 token (字元/4) 過長才啟用壓縮。
+1. 估算 token 過長才啟用壓縮 (先以字元數粗估，接近閾值時才以 tiktoken 精算)。
 2. 分塊 (chunk) 切割：控制每塊近似 token 大小，避免單塊過大。
 3. 地點候選偵測：簡單規則 + 關鍵字；含地點的塊保留更多原文行。
 4. 其餘行進行摘要：若可使用 LLM 則用，否則以啟發式 (取前幾行 + 句子截斷)。
@@ -13,7 +13,6 @@
 與先前建議差異：為避免在無 API Key/離線測試時失敗，加入 fallback heuristic。
 
 後續可擴充：
-- tiktoken 精準 token 估算
 - JSON 結構化中繼摘要
 - Embedding 過濾無關主題句段
 - 地點與原文行對齊 timecode 保留 (現假設原行可能已包含時間資訊)
@@ -23,12 +22,20 @@ from __future__ import annotations
 
 import re
 import hashlib
+from bisect import bisect_left
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, replace
+from itertools import accumulate, islice
 from src.api.core.logger_config import get_logger
-from typing import List, Dict, Optional, Type
+from typing import Dict, List, Optional, Tuple, Type
 from pydantic import BaseModel, Field
 from crewai.tools import BaseTool
 from crewai import LLM
 
+from src.common.disk_cache import get_disk_cache
+from .token_counter import count_tokens, get_encoding
+
 logger = get_logger(__name__)
 
 # -------------------- 參數可調 --------------------
@@ -37,6 +44,14 @@ CHUNK_TARGET_TOKENS = 800  # 單 chunk 目標 token (估算值)
 HIGH_IMPORTANCE_KEEP_RATIO = 0.85  # 含地點 chunk 原文保留比例
 NORMAL_KEEP_RATIO = 0.35  # 一般 chunk 原文保留比例
 MIN_LOCATION_RECALL = 3  # 若地點過少可考慮後續擴充重跑 (目前僅紀錄)
+TOKENIZER_MODEL = "gpt-4o-mini"  # 精算 token 時使用的 tiktoken 模型
+ESTIMATE_REFINE_MARGIN = 0.2  # 粗估值落在閾值 ±20% 內時改以 tiktoken 精算
+SUMMARY_CACHE_MAXSIZE = 1024  # 記憶體中保留的分塊摘要數 (LRU)
+SUMMARY_DISK_TTL = 30 * 86400  # LLM 分塊摘要的磁碟快取存活秒數
+LLM_BATCH_CHUNKS = 4  # 單次 LLM 呼叫合併摘要的分塊數 (受 max_tokens=1200 輸出上限約束)
+LLM_MAX_WORKERS = 8  # 同時進行的 LLM 批次呼叫數
+MARGINAL_OVERSHOOT_RATIO = 1.15  # 估計值未超過閾值此倍數時，先嘗試僅截取地點行
+TRUNCATE_CONTEXT_LINES = 30  # 截取時額外保留的開頭/結尾行數 (語境)
 
 LOCATION_KEYWORDS = [
     # English common location types
@@ -264,6 +279,96 @@ LOCATION_KEYWORDS = [
     "里",
 ]
 LOCATION_REGEX = re.compile(r"\b([A-Z][a-zA-Z]{2,}(?:\s+[A-Z][a-zA-Z]{2,})*)\b")
+# 連續中日韓統一表意文字，以整段比對減少匹配物件數
+_CJK_RUN_RE = re.compile(r"[\u4e00-\u9fff]+")
+# 估算中文比例時僅取樣開頭的字元數，避免長字幕全文掃描
+_CJK_SAMPLE_CHARS = 4096
+# 批次摘要回應中各分塊的標頭，如 "### CHUNK 3 ###"
+_CHUNK_HEADER_RE = re.compile(r"^\s*#{3}\s*CHUNK\s+(\d+)\s*#{3}\s*$", re.M | re.I)
+# (小寫關鍵字, 原始關鍵字)，掃描時不必逐一重新轉小寫；重複關鍵字只保留一次
+_LOCATION_KEYWORD_PAIRS = tuple(
+    dict.fromkeys((kw.lower(), kw) for kw in LOCATION_KEYWORDS)
+)
+# 依文字系統分組：純 ASCII 的行不可能含中文關鍵字，不含英文字母的行也不可能含英文關鍵字，
+# 逐一比對時只需檢查對應的一組
+_ASCII_KEYWORD_PAIRS = tuple(
+    pair for pair in _LOCATION_KEYWORD_PAIRS if pair[0].isascii()
+)
+_NON_ASCII_KEYWORD_PAIRS = tuple(
+    pair for pair in _LOCATION_KEYWORD_PAIRS if not pair[0].isascii()
+)
+_ASCII_LETTER_RE = re.compile(r"[a-z]")
+
+# 安裝 pyahocorasick 時將所有關鍵字編譯為單一 Aho-Corasick 自動機，
+# 一次掃描文字即可找出所有 (含重疊) 命中，取代逐一關鍵字的子字串搜尋
+try:
+    import ahocorasick
+
+    _KEYWORD_AUTOMATON = ahocorasick.Automaton()
+    for _kw_lower, _kw in _LOCATION_KEYWORD_PAIRS:
+        _KEYWORD_AUTOMATON.add_word(_kw_lower, _kw)
+    _KEYWORD_AUTOMATON.make_automaton()
+except ImportError:
+    _KEYWORD_AUTOMATON = None
+
+
+def _match_keywords(lowered: str) -> set[str]:
+    """找出已轉小寫文字中出現的所有地點關鍵字 (含重疊命中)，回傳原始關鍵字"""
+    if _KEYWORD_AUTOMATON is not None:
+        return {kw for _, kw in _KEYWORD_AUTOMATON.iter(lowered)}
+    if lowered.isascii():
+        pairs = _ASCII_KEYWORD_PAIRS
+    elif _ASCII_LETTER_RE.search(lowered) is None:
+        pairs = _NON_ASCII_KEYWORD_PAIRS
+    else:
+        pairs = _LOCATION_KEYWORD_PAIRS
+    return {kw for kw_lower, kw in pairs if kw_lower in lowered}
+
+
+# 持久化分塊摘要快取 (SQLite)，讓 LLM 摘要在程序重啟後仍可重用；
+# 僅保存 LLM 產生的摘要，啟發式結果重算成本低不需落地；首次查詢時才開啟
+SUMMARY_DISK_CACHE = "subtitle_summaries"
+
+
+def _cjk_ratio(text: str) -> float:
+    """取樣文字開頭，計算中日韓表意文字所佔比例 (0.0 ~ 1.0)"""
+    sample = text[:_CJK_SAMPLE_CHARS]
+    if not sample:
+        return 0.0
+    return sum(map(len, _CJK_RUN_RE.findall(sample))) / len(sample)
+
+
+def _tok_len(text: str) -> int:
+    """以 tiktoken 計算文字 token 數；編碼器無法載入時 (如離線無法下載 BPE 檔) 退回字元數粗估"""
+    try:
+        return count_tokens(text, TOKENIZER_MODEL)
+    except Exception:
+        return max(1, len(text) // 4)
+
+
+def _line_token_counts(lines: List[str]) -> List[int]:
+    """
+    計算各行 token 數
+
+    重複行 (音樂提示、講者標記等) 只編碼一次；字幕行多為短句，逐行以 encode_ordinary
+    序列編碼，避免 encode_ordinary_batch 為每行建立 future 的執行緒池開銷。
+    編碼器無法載入時退回字元數粗估。
+    """
+    try:
+        encode = get_encoding(TOKENIZER_MODEL).encode_ordinary
+    except Exception:
+        return [max(1, len(line) // 4) for line in lines]
+    counts = {line: len(encode(line)) for line in dict.fromkeys(lines)}
+    return [counts[line] for line in lines]
+
+
+@dataclass(slots=True)
+class AnnotatedLine:
+    """分塊時標註的字幕行：原文、token 數與該行偵測到的地點"""
+
+    text: str
+    token_count: int
+    locations: Tuple[str, ...]
 
 
 class SubtitleCompressionInput(BaseModel):
@@ -277,8 +382,9 @@ class SubtitleCompressionInput(BaseModel):
     search_subject: Optional[str] = Field(None, description="主題焦點 (可選)。")
 
 
-class ChunkSummary(BaseModel):
-    """單一分塊摘要資訊
+@dataclass(slots=True)
+class ChunkSummary:
+    """單一分塊摘要資訊 (內部資料，不需 pydantic 驗證)
 
     chunk_index: 分塊索引
     detected_locations: 偵測到的地點關鍵字
@@ -319,14 +425,15 @@ class SubtitleCompressionTool(BaseTool):
         except Exception as e:  # pragma: no cover - 初始化失敗 fallback
             logger.warning(f"LLM 初始化失敗, 將使用啟發式摘要: {e}")
             self.llm = None
-        self._cache: Dict[str, ChunkSummary] = {}
+        self._cache: "OrderedDict[int, ChunkSummary]" = OrderedDict()
 
     # --------------- 主流程 ---------------
     def _run(self, subtitle_text: str, search_subject: Optional[str] = None) -> str:
         """
         主執行流程：
         1. 若字幕長度未超過 token 閾值，直接回傳原字幕。
-        2. 否則進行分塊、地點偵測、摘要與組合。
+        2. 僅略為超過時，先嘗試只保留含地點行與首尾語境，截取後未超過閾值即回傳。
+        3. 否則進行分塊、地點偵測、摘要與組合。
         """
         if not subtitle_text:
             return ""
@@ -335,23 +442,14 @@ class SubtitleCompressionTool(BaseTool):
             return subtitle_text  # 不壓縮
 
         lines = self._split_lines(subtitle_text)
+        if est_tokens <= MAX_FINAL_TOKENS * MARGINAL_OVERSHOOT_RATIO:
+            # 僅略超過閾值：保留含地點行與首尾語境即可，不需分塊與 LLM 摘要
+            truncated = self._truncate_to_locations(lines)
+            if self._estimate_tokens(truncated) <= MAX_FINAL_TOKENS:
+                return truncated
+
         chunks = self._group_into_chunks(lines)
-        summaries: List[ChunkSummary] = []
-        for idx, chunk_lines in enumerate(chunks):
-            chunk_text = "\n".join(chunk_lines)
-            detected = self._detect_locations(chunk_text)
-            importance_ratio = (
-                HIGH_IMPORTANCE_KEEP_RATIO if detected else NORMAL_KEEP_RATIO
-            )
-            summaries.append(
-                self._summarize_chunk(
-                    idx=idx,
-                    lines=chunk_lines,
-                    detected_locations=detected,
-                    keep_ratio=importance_ratio,
-                    search_subject=search_subject or "",
-                )
-            )
+        summaries = self._summarize_chunks(chunks, search_subject or "")
 
         # 地點召回資訊 (暫記錄日志, 後續可擴充第二輪)
         all_locations = {l for s in summaries for l in s.detected_locations}  # noqa: E741
@@ -365,129 +463,310 @@ class SubtitleCompressionTool(BaseTool):
     # --------------- 工具函式 ---------------
     def _estimate_tokens(self, text: str) -> int:
         """
-        粗略估算 token 數量（1 token ≈ 4 字元，適用於中英文混合）
+        估算 token 數量
+
+        先以字元數粗估（中文約 1 字 1 token，其餘約 4 字元 1 token，依中文比例加權，
+        中英夾雜字幕不會整段被當成中文或英文）；
+        僅在粗估值接近 MAX_FINAL_TOKENS 而無法確定是否需壓縮時，才以 tiktoken 精算。
         """
-        return max(1, len(text) // 4)
+        ratio = _cjk_ratio(text)
+        estimate = int(len(text) * (ratio + (1.0 - ratio) / 4))
+        margin = MAX_FINAL_TOKENS * ESTIMATE_REFINE_MARGIN
+        if abs(estimate - MAX_FINAL_TOKENS) <= margin:
+            return max(1, _tok_len(text))
+        return max(1, estimate)
 
     def _split_lines(self, text: str) -> List[str]:
         """
-        將字幕文字依行切割並去除空白行
+        將字幕文字依行切割並去除空白行 (每行只 strip 一次)
         """
-        return [line.strip() for line in text.splitlines() if line.strip()]
+        return [stripped for line in text.splitlines() if (stripped := line.strip())]
 
-    def _group_into_chunks(self, lines: List[str]) -> List[List[str]]:
+    def _truncate_to_locations(self, lines: List[str]) -> str:
+        """
+        截取含地點的行，另保留開頭與結尾各 TRUNCATE_CONTEXT_LINES 行作為語境
+
+        地點判定規則與分組時相同 (關鍵字或專有名詞樣式)，保留行維持原順序。
+        """
+        head_end = TRUNCATE_CONTEXT_LINES
+        tail_start = len(lines) - TRUNCATE_CONTEXT_LINES
+        lowered_lines = "\n".join(lines).lower().split("\n")
+        return "\n".join(
+            line
+            for i, (line, lowered) in enumerate(zip(lines, lowered_lines))
+            if i < head_end
+            or i >= tail_start
+            or _match_keywords(lowered)
+            or LOCATION_REGEX.search(line)
+        )
+
+    def _group_into_chunks(self, lines: List[str]) -> List[List[AnnotatedLine]]:
         """
         將字幕行依據目標 token 數分組，避免單一分塊過大
+
+        分組的同一輪掃描中一併計算每行 token 數與偵測地點，後續步驟直接讀取標註，
+        不再重新掃描分塊文字。
         """
-        chunks: List[List[str]] = []
-        current: List[str] = []
+        # 全文一次轉小寫後再切回各行，省去逐行呼叫 lower；
+        # 轉小寫不會產生或移除換行，切割後行數必與原文一致
+        lowered_lines = "\n".join(lines).lower().split("\n")
+
+        chunks: List[List[AnnotatedLine]] = []
+        current: List[AnnotatedLine] = []
         token_sum = 0
-        for line in lines:
-            t = self._estimate_tokens(line)
+        for line, lowered, t in zip(lines, lowered_lines, _line_token_counts(lines)):
+            found = _match_keywords(lowered)
+            for m in LOCATION_REGEX.findall(line):
+                if len(m) >= 3:
+                    found.add(m.strip())
+            annotated = AnnotatedLine(text=line, token_count=t, locations=tuple(found))
             if token_sum + t > CHUNK_TARGET_TOKENS and current:
                 chunks.append(current)
-                current = [line]
+                current = [annotated]
                 token_sum = t
             else:
-                current.append(line)
+                current.append(annotated)
                 token_sum += t
         if current:
             chunks.append(current)
         return chunks
 
-    def _detect_locations(self, text: str) -> List[str]:
+    def _detect_locations(self, lines: List[AnnotatedLine]) -> List[str]:
         """
-        偵測字幕片段中出現的地點關鍵字或專有名詞
+        取得分塊中出現的地點，即各行標註地點的聯集
         """
-        found = set()
-        lower = text.lower()
-        for kw in LOCATION_KEYWORDS:
-            if kw.lower() in lower:
-                found.add(kw)
-        for m in LOCATION_REGEX.findall(text):
-            if len(m) >= 3:
-                found.add(m.strip())
-        return list(found)
-
-    def _summarize_chunk(
+        return list(set().union(*(line.locations for line in lines)))
+
+    def _summarize_chunks(
+        self, chunks: List[List[AnnotatedLine]], search_subject: str
+    ) -> List[ChunkSummary]:
+        """
+        對所有分塊進行摘要：
+        - 優先保留含地點的原文行
+        - 其餘行摘要（優先 LLM，多個分塊合併為一次呼叫；失敗則啟發式）
+        - 結果快取避免重複運算
+        """
+        summaries: List[Optional[ChunkSummary]] = [None] * len(chunks)
+        # 待 LLM 摘要的分塊: (分塊索引, 快取鍵, 其餘文字)
+        pending: List[Tuple[int, int, str]] = []
+        for idx, lines in enumerate(chunks):
+            detected = self._detect_locations(lines)
+            keep_ratio = HIGH_IMPORTANCE_KEEP_RATIO if detected else NORMAL_KEEP_RATIO
+            key = self._chunk_cache_key(lines, detected, keep_ratio, search_subject)
+            cached = self._cache_lookup(key)
+            if cached is not None:
+                if cached.chunk_index != idx:
+                    cached = replace(cached, chunk_index=idx)
+                summaries[idx] = cached
+                continue
+
+            kept, remaining_text = self._select_kept_lines(lines, detected, keep_ratio)
+            summaries[idx] = ChunkSummary(
+                chunk_index=idx,
+                detected_locations=detected,
+                kept_lines=kept,
+                summarized_points=[],
+            )
+            if remaining_text and self.llm is not None:
+                pending.append((idx, key, remaining_text))
+            else:
+                summaries[idx].summarized_points = self._heuristic_points(
+                    remaining_text
+                )
+                self._cache_store(key, summaries[idx], persist=False)
+
+        # 其餘摘要：每批數個分塊合併為單一 prompt 減少往返次數，各批次再以執行緒
+        # 並行呼叫 (LLM 呼叫為 I/O 等待)；快取讀寫皆留在呼叫端執行緒，不需加鎖
+        batches = [
+            pending[start : start + LLM_BATCH_CHUNKS]
+            for start in range(0, len(pending), LLM_BATCH_CHUNKS)
+        ]
+        if not batches:
+            return summaries
+        with ThreadPoolExecutor(
+            max_workers=min(LLM_MAX_WORKERS, len(batches))
+        ) as executor:
+            results = list(
+                executor.map(
+                    lambda batch: self._llm_batch_points(
+                        [(idx, text) for idx, _, text in batch], search_subject
+                    ),
+                    batches,
+                )
+            )
+        for batch, points_by_idx in zip(batches, results):
+            for idx, key, remaining_text in batch:
+                points = points_by_idx.get(idx)
+                if points:
+                    summaries[idx].summarized_points = points
+                    self._cache_store(key, summaries[idx], persist=True)
+                else:
+                    # 該分塊 LLM 無回應或解析失敗，僅此分塊改用啟發式
+                    summaries[idx].summarized_points = self._heuristic_points(
+                        remaining_text
+                    )
+                    self._cache_store(key, summaries[idx], persist=False)
+
+        return summaries
+
+    def _chunk_cache_key(
         self,
-        idx: int,
-        lines: List[str],
+        lines: List[AnnotatedLine],
         detected_locations: List[str],
         keep_ratio: float,
         search_subject: str,
-    ) -> ChunkSummary:
+    ) -> int:
         """
-        對單一分塊進行摘要：
-        - 優先保留含地點的原文行
-        - 其餘行摘要（優先 LLM，失敗則啟發式）
-        - 結果快取避免重複運算
+        產生分塊摘要快取鍵值
+
+        僅供去重不需密碼學強度，以 BLAKE2b-128 逐段更新，不先組出整段字串；
+        回傳 128 位元整數，作為 dict 鍵值比十六進位字串更省記憶體且比較更快。
+        """
+        hasher = hashlib.blake2b(digest_size=16)
+        update = hasher.update
+        for line in lines:
+            update(line.text.encode("utf-8"))
+            update(b"\n")
+        # 摘要內容取決於 LLM 模型，模型納入鍵值避免不同模型 (或無 LLM) 的結果混用
+        model = getattr(self.llm, "model", None) if self.llm is not None else None
+        for location in sorted(detected_locations):
+            update(b"|")
+            update(location.encode("utf-8"))
+        update(
+            f"||{keep_ratio}|{search_subject}|{model or 'heuristic'}".encode("utf-8")
+        )
+        return int.from_bytes(hasher.digest(), "big")
+
+    def _select_kept_lines(
+        self,
+        lines: List[AnnotatedLine],
+        detected_locations: List[str],
+        keep_ratio: float,
+    ) -> Tuple[List[str], str]:
         """
-        # cache key
-        raw_text = "\n".join(lines)
-        h = hashlib.sha256(
-            (
-                raw_text
-                + "|"
-                + ",".join(sorted(detected_locations))
-                + f"|{keep_ratio}|{search_subject}"
-            ).encode("utf-8")
-        ).hexdigest()
-        if h in self._cache:
-            return self._cache[h]
-
-        # 計算要保留的原文行數
-        keep_count = max(1, int(len(lines) * keep_ratio))
+        選出保留的原文行
+
+        保留量以 token 預算 (分塊總 token 數 × keep_ratio) 而非行數計算，
+        避免長行使保留內容超出目標；補行時以前綴和二分搜尋找出截斷位置。
+
+        Returns:
+            (保留的原文行, 其餘待摘要的文字)
+        """
+        budget = int(sum(line.token_count for line in lines) * keep_ratio)
         kept: List[str] = []
+        kept_set: set[str] = set()  # 與 kept 同步，供 O(1) 成員判斷
+        kept_tokens = 0
         if detected_locations:
-            # 先收集含地點的行
+            # 先收集含地點的行 (分組時已標註各行地點)
             for line in lines:
-                if any(loc in line for loc in detected_locations):
-                    kept.append(line)
-            # 若仍不足 keep_count，補前幾行
-        if len(kept) < keep_count:
+                if line.locations:
+                    kept.append(line.text)
+                    kept_set.add(line.text)
+                    kept_tokens += line.token_count
+        # 若仍不足 token 預算，依序補前幾行 (重複文字僅取第一次出現)
+        if kept_tokens < budget or not kept:
+            fill: Dict[str, int] = {}
             for line in lines:
-                if line not in kept:
-                    kept.append(line)
-                if len(kept) >= keep_count:
-                    break
-
-        # 其餘摘要：
-        summarized_points: List[str] = []
-        remaining_text = "\n".join([line for line in lines if line not in kept])
-        if remaining_text and self.llm is not None:
-            prompt = (
-                "你是字幕壓縮助手，僅用原文重述重點，不新增不存在資訊。\n"
-                f"主題焦點: {search_subject or 'N/A'}\n"
-                "以下是需濃縮的字幕片段:\n" + remaining_text + "\n"
-                "請輸出 3~6 條精簡要點 (不帶編號，只是一行一點)。"
-            )
-            try:
-                resp = self.llm.invoke(prompt=prompt)
-                raw = (
-                    getattr(resp, "raw", None)
-                    or getattr(resp, "output", None)
-                    or str(resp)
-                )
-                # 切行過濾空白
-                summarized_points = [
-                    r.strip("- ") for r in raw.splitlines() if r.strip()
-                ][:6]
-            except Exception as e:  # pragma: no cover - LLM 失敗 fallback
-                logger.warning(f"LLM 摘要失敗, 使用啟發式: {e}")
-                summarized_points = self._heuristic_points(remaining_text)
-        else:
-            summarized_points = self._heuristic_points(remaining_text)
-
-        cs = ChunkSummary(
-            chunk_index=idx,
-            detected_locations=detected_locations,
-            kept_lines=kept,
-            summarized_points=summarized_points,
+                if line.text not in kept_set and line.text not in fill:
+                    fill[line.text] = line.token_count
+            prefix = list(accumulate(fill.values()))
+            # 取最少行數使累計 token 達到預算，至少保留一行
+            cutoff = max(1, bisect_left(prefix, budget - kept_tokens) + 1)
+            for text in islice(fill, cutoff):
+                kept.append(text)
+                kept_set.add(text)
+
+        remaining_text = "\n".join(
+            line.text for line in lines if line.text not in kept_set
+        )
+        return kept, remaining_text
+
+    def _llm_batch_points(
+        self, items: List[Tuple[int, str]], search_subject: str
+    ) -> Dict[int, List[str]]:
+        """
+        以單次 LLM 呼叫摘要多個分塊
+
+        各分塊以 "### CHUNK i ###" 標頭分隔，回應依相同標頭切回各分塊。
+
+        Args:
+            items: (分塊索引, 待摘要文字) 列表
+            search_subject: 主題焦點
+
+        Returns:
+            分塊索引 -> 要點列表；LLM 失敗或未回應的分塊不在結果中
+        """
+        blocks = "".join(f"### CHUNK {idx} ###\n{text}\n" for idx, text in items)
+        prompt = (
+            "你是字幕壓縮助手，僅用原文重述重點，不新增不存在資訊。\n"
+            f"主題焦點: {search_subject or 'N/A'}\n"
+            "以下是需濃縮的字幕片段，各片段以 ### CHUNK 編號 ### 標頭分隔:\n"
+            + blocks
+            + "請依序對每個片段輸出相同的 ### CHUNK 編號 ### 標頭，"
+            "其後輸出 3~6 條精簡要點 (不帶編號，只是一行一點)。"
         )
-        self._cache[h] = cs
+        try:
+            resp = self.llm.invoke(prompt=prompt)
+            raw = (
+                getattr(resp, "raw", None) or getattr(resp, "output", None) or str(resp)
+            )
+        except Exception as e:  # pragma: no cover - LLM 失敗 fallback
+            logger.warning(f"LLM 摘要失敗, 使用啟發式: {e}")
+            return {}
+
+        # re.split 含擷取群組: [標頭前文字, 編號1, 內容1, 編號2, 內容2, ...]
+        parts = _CHUNK_HEADER_RE.split(raw)
+        requested = {idx for idx, _ in items}
+        points_by_idx: Dict[int, List[str]] = {}
+        for number, body in zip(parts[1::2], parts[2::2]):
+            idx = int(number)
+            if idx not in requested:
+                continue
+            # 切行過濾空白
+            points = [r.strip("- ") for r in body.splitlines() if r.strip()][:6]
+            if points:
+                points_by_idx[idx] = points
+        if len(points_by_idx) < len(requested):
+            logger.warning(
+                f"LLM 批次摘要缺少 {len(requested) - len(points_by_idx)} 個分塊, 改用啟發式"
+            )
+        return points_by_idx
+
+    def _cache_lookup(self, key: int) -> Optional[ChunkSummary]:
+        """依序查詢記憶體 LRU 與磁碟快取，磁碟命中時回填記憶體；未命中回傳 None"""
+        cs = self._cache.get(key)
+        if cs is not None:
+            self._cache.move_to_end(key)
+            return cs
+        summary_disk = get_disk_cache(SUMMARY_DISK_CACHE)
+        if summary_disk is None:
+            return None
+        try:
+            record = summary_disk.get(f"{key:032x}")
+            if record is None:
+                return None
+            cs = ChunkSummary(**record)
+        except Exception as e:
+            logger.warning(f"讀取分塊摘要磁碟快取失敗: {e}")
+            return None
+        self._cache_store(key, cs, persist=False)
         return cs
 
+    def _cache_store(self, key: int, cs: ChunkSummary, persist: bool) -> None:
+        """寫入記憶體 LRU (超過容量時淘汰最久未使用者)，persist 為 True 時一併寫入磁碟"""
+        self._cache[key] = cs
+        self._cache.move_to_end(key)
+        if len(self._cache) > SUMMARY_CACHE_MAXSIZE:
+            self._cache.popitem(last=False)
+        if not persist:
+            return
+        summary_disk = get_disk_cache(SUMMARY_DISK_CACHE)
+        if summary_disk is not None:
+            try:
+                summary_disk.set(f"{key:032x}", asdict(cs), expire=SUMMARY_DISK_TTL)
+            except Exception as e:
+                logger.warning(f"寫入分塊摘要磁碟快取失敗: {e}")
+
     def _heuristic_points(self, text: str) -> List[str]:
         """
         啟發式摘要：將剩餘文字依句號等標點切割，取前幾句作為重點
@@ -501,18 +780,21 @@ class SubtitleCompressionTool(BaseTool):
     def _compose_final_text(self, summaries: List[ChunkSummary]) -> str:
         """
         將所有分塊摘要組合為最終壓縮字幕字串
+
+        每個區段 (地點標頭、原文行、摘要重點) 以帶前綴的分隔字串一次 join，
+        外層清單只收集區段而非逐行，避免逐行格式化與大量清單元素。
         """
-        out_lines: List[str] = []
+        sections: List[str] = []
         for s in summaries:
             if s.detected_locations:
-                out_lines.append(
+                sections.append(
                     f"[Chunk {s.chunk_index} 地點]: {', '.join(s.detected_locations)}"
                 )
-            for line in s.kept_lines:
-                out_lines.append(f"*原文* {line}")
-            for p in s.summarized_points:
-                out_lines.append(f"- {p}")
-        return "\n".join(out_lines)
+            if s.kept_lines:
+                sections.append("*原文* " + "\n*原文* ".join(s.kept_lines))
+            if s.summarized_points:
+                sections.append("- " + "\n- ".join(s.summarized_points))
+        return "\n".join(sections)
 
 
 if __name__ == "__main__":  # 簡易手動測試
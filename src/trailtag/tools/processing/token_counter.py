@@ -5,19 +5,76 @@ token_count_tool.py
 預設使用 OpenAI 的 tiktoken，支援多種模型。
 """
 
+import os
+import re
+from functools import lru_cache
+
 import tiktoken
 
+# 超過此字元數的文字切成多段並行編碼，每段約 _PARALLEL_WINDOW 字元
+_PARALLEL_THRESHOLD = 200_000
+_PARALLEL_WINDOW = 50_000
+# 切割點：換行之後緊接非空白字元
+_SPLIT_POINT_RE = re.compile(r"\n(?=\S)")
+# 平均長度達此字元數才使用多執行緒批次編碼；短文字的執行緒排程開銷高於編碼本身
+_BATCH_MIN_AVG_CHARS = 10_000
+
+
+@lru_cache(maxsize=16)
+def get_encoding(model: str) -> tiktoken.Encoding:
+    """取得模型對應的 tiktoken 編碼器，依模型名稱快取以免每次呼叫重新初始化"""
+    return tiktoken.encoding_for_model(model)
+
+
+def _split_at_newlines(text: str, size: int) -> list[str]:
+    """
+    於換行處將長文字切成約 size 字元的片段，換行保留在前一段結尾。
+    僅在換行後緊接非空白字元處切割：BPE 前置切詞不會將換行與其後的文字合併，
+    因此各段分別編碼的 token 總數與整段編碼一致；找不到切點時其餘文字不再切割。
+    """
+    parts = []
+    start = 0
+    while len(text) - start > size:
+        m = _SPLIT_POINT_RE.search(text, start + size)
+        if m is None:
+            break
+        parts.append(text[start : m.end()])
+        start = m.end()
+    parts.append(text[start:])
+    return parts
+
 
 def count_tokens(text: str, model: str = "gpt-3.5-turbo") -> int:
     """
     計算輸入字串經指定 LLM 模型 tokenizer 處理後的 token 數量。
+    使用 encode_ordinary：特殊 token 字樣視為一般文字，省去特殊 token 掃描，
+    且輸入含 "<|endoftext|>" 等字樣時不會拋出例外。
     :param text: 輸入字串
-    :param model: LLM 模型名稱，預設為 gpt-4o-mini
+    :param model: LLM 模型名稱，預設為 gpt-3.5-turbo
     :return: token 數量
     """
-    encoding = tiktoken.encoding_for_model(model)
-    tokens = encoding.encode(text)
-    return len(tokens)
+    if len(text) > _PARALLEL_THRESHOLD:
+        # 超長文字 (如整部影片字幕) 於換行處切段，以多執行緒並行編碼後加總
+        return sum(count_tokens_many(_split_at_newlines(text, _PARALLEL_WINDOW), model))
+    return len(get_encoding(model).encode_ordinary(text))
+
+
+def count_tokens_many(texts: list[str], model: str = "gpt-3.5-turbo") -> list[int]:
+    """
+    批次計算多個字串的 token 數量。
+    encode_ordinary_batch 以執行緒池為每個字串建立一個 future，只對少量長文字
+    (如切段後的整部字幕) 劃算；平均長度低於 _BATCH_MIN_AVG_CHARS 時逐一序列編碼。
+    :param texts: 輸入字串列表
+    :param model: LLM 模型名稱，預設為 gpt-3.5-turbo
+    :return: 與 texts 順序對應的 token 數量列表
+    """
+    encoding = get_encoding(model)
+    if len(texts) < 2 or sum(map(len, texts)) < _BATCH_MIN_AVG_CHARS * len(texts):
+        return [len(encoding.encode_ordinary(text)) for text in texts]
+    encoded = encoding.encode_ordinary_batch(
+        texts, num_threads=min(len(texts), os.cpu_count() or 1)
+    )
+    return [len(tokens) for tokens in encoded]
 
 
 if __name__ == "__main__":
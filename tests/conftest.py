@@ -1,4 +1,35 @@
 import sys
 import os
+import shutil
+import tempfile
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--record-metrics",
+        action="store_true",
+        default=False,
+        help="Output the e2e performance report (limits are always enforced)",
+    )
+
+
+def pytest_configure(config):
+    if config.getoption("--record-metrics"):
+        os.environ["TRAILTAG_RECORD_METRICS"] = "1"
+
+    # Keep the memory store out of the repo's tracked crewai_storage/: unless the
+    # caller chose a directory, use a temporary one removed at the end of the run
+    if "CREWAI_STORAGE_DIR" not in os.environ:
+        storage_dir = tempfile.mkdtemp(prefix="trailtag_crewai_")
+        os.environ["CREWAI_STORAGE_DIR"] = storage_dir
+        config.add_cleanup(lambda: shutil.rmtree(storage_dir, ignore_errors=True))
+
+    # pytest-xdist: give each worker its own memory store so parallel workers do
+    # not overwrite each other's JSON files (global singletons are per-process)
+    xdist_worker = os.environ.get("PYTEST_XDIST_WORKER")
+    if xdist_worker:
+        os.environ["CREWAI_STORAGE_DIR"] = os.path.join(
+            os.environ["CREWAI_STORAGE_DIR"], xdist_worker
+        )
@@ -0,0 +1,85 @@
+"""
+CrewAI Memory Cache Provider Tests
+
+Validates the batched get_many/set_many operations of the CrewAI Memory cache
+provider against the single-key get/set behaviour they replace.
+"""
+
+import sys
+import os
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from src.api.cache.cache_provider import CrewAICacheProvider
+
+
+class TestCacheProviderBatchOperations:
+    """Test batched cache reads and writes"""
+
+    @pytest.fixture(autouse=True)
+    def setup_provider(self, tmp_path, monkeypatch):
+        """Create a provider backed by an isolated memory store"""
+        monkeypatch.setenv("CREWAI_STORAGE_DIR", str(tmp_path / "crewai_storage"))
+        self.provider = CrewAICacheProvider()
+
+    def _latest_cache_entry(self, query: str):
+        """Return metadata of the newest non-deleted cache record for a query"""
+        entries = [
+            entry.metadata
+            for entry in self.provider.memory.memory_storage.memories.values()
+            if entry.metadata.get("type") == "cache"
+            and not entry.metadata.get("deleted", False)
+            and entry.metadata.get("original_query") == query
+        ]
+        return max(entries, key=lambda metadata: metadata["stored_at"])
+
+    def test_get_many_partial_hits(self):
+        """Test get_many returns hits in query order and None for misses"""
+        job = {"job_id": "job-1", "status": "queued"}
+        self.provider.set("job:job-1", job)
+        self.provider.set("video_job:abc123", "job-1")
+
+        results = self.provider.get_many(
+            ["video_job:abc123", "analysis:missing", "job:job-1"]
+        )
+
+        assert results == ["job-1", None, job]
+
+    def test_get_many_matches_get(self):
+        """Test get_many returns the latest value, as get does"""
+        self.provider.set("analysis:abc123", {"version": 1})
+        self.provider.set("analysis:abc123", {"version": 2})
+
+        assert self.provider.get_many(["analysis:abc123"]) == [
+            self.provider.get("analysis:abc123")
+        ]
+        assert self.provider.get_many(["analysis:abc123"]) == [{"version": 2}]
+
+    def test_set_many_records_ttl(self):
+        """Test set_many stores every item with the given TTL"""
+        stored = self.provider.set_many(
+            [("job:job-2", {"job_id": "job-2"}), ("video_job:def456", "job-2")],
+            ttl=60,
+        )
+
+        assert stored == 2
+        for query in ("job:job-2", "video_job:def456"):
+            assert self._latest_cache_entry(query)["ttl"] == 60
+
+        assert self.provider.get_many(["job:job-2", "video_job:def456"]) == [
+            {"job_id": "job-2"},
+            "job-2",
+        ]
+
+    def test_set_many_replaces_existing_entries(self):
+        """Test set_many soft-deletes previous values like set does"""
+        self.provider.set("video_job:abc123", "old-job", ttl=30)
+
+        stored = self.provider.set_many([("video_job:abc123", "new-job")])
+
+        assert stored == 1
+        assert self.provider.get("video_job:abc123") == "new-job"
+        assert self.provider.get_many(["video_job:abc123"]) == ["new-job"]
+        assert self._latest_cache_entry("video_job:abc123")["ttl"] is None
@@ -28,7 +28,7 @@ import pytest
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
 from typing import Dict, Any, List
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
@@ -269,6 +269,42 @@ class TestMemorySystemFunctionality(MemorySystemTestBase):
 
         logger.info("Agent memory operations test passed")
 
+    @pytest.mark.asyncio
+    async def test_agent_memory_bulk_save(self):
+        """Test bulk agent memory save persists every entry in one write"""
+        memory_manager = CrewMemoryManager(self.test_config)
+
+        items = [
+            {
+                "agent_role": "bulk_agent" if i % 2 else "other_agent",
+                "context": f"Bulk context {i} about Kyoto",
+                "confidence": 0.8,
+            }
+            for i in range(10)
+        ]
+
+        with patch.object(
+            memory_manager,
+            "_persist_agent_memory",
+            wraps=memory_manager._persist_agent_memory,
+        ) as mock_persist:
+            memory_ids = memory_manager.save_agent_memory_bulk(items)
+
+        assert mock_persist.call_count == 1
+        assert memory_ids == [
+            f"{item['agent_role']}_{i // 2 + 1}" for i, item in enumerate(items)
+        ]
+
+        # A fresh manager loads every entry back from the single write
+        reloaded_manager = CrewMemoryManager(self.test_config)
+        assert len(reloaded_manager.agent_memories["bulk_agent"]) == 5
+        assert len(reloaded_manager.agent_memories["other_agent"]) == 5
+        assert [m.context for m in reloaded_manager.agent_memories["bulk_agent"]] == [
+            item["context"] for item in items if item["agent_role"] == "bulk_agent"
+        ]
+
+        logger.info("Agent memory bulk save test passed")
+
     @pytest.mark.asyncio
     async def test_memory_search_functionality(self):
         """Test memory search and vector capabilities"""
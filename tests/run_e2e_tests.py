@@ -129,7 +129,11 @@ def main():
     extra_args = []
 
     if args.parallel:
-        extra_args.extend(["-n", "auto"])
+        # Keep each test class on one worker so class-scoped fixtures are shared
+        extra_args.extend(["-n", "auto", "--dist", "loadscope"])
+
+    if args.report:
+        extra_args.append("--record-metrics")
 
     if args.coverage:
         extra_args.extend(["--cov=src", "--cov-report=term-missing"])